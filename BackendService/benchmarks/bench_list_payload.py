@@ -0,0 +1,86 @@
+"""
+List-page payload benchmark: bytes on the wire and per-request CPU for
+GET /items with and without a sparse fieldset, with and without gzip.
+
+Run from the BackendService directory:
+
+    python -m benchmarks.bench_list_payload --items 1000 --per-page 50 --requests 200
+"""
+import argparse
+import json
+import time
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from src.api.core.dependencies import get_repository
+from src.api.main import create_app
+from src.api.models.domain import FoodItem
+from src.api.repositories.memory_repo import InMemoryRepository
+
+LIST_VIEW_FIELDS = "id,name,price,avg_rating"
+
+
+def build_repo(n: int) -> InMemoryRepository:
+    repo = InMemoryRepository()
+    for i in range(n):
+        repo.create_item(FoodItem(
+            id=str(uuid4()),
+            name=f"Dish {i}",
+            description="A long-form recipe description with ingredients and preparation notes. " * 6,
+            category="Main Course" if i % 2 else "Dessert",
+            price=5.0 + i % 40,
+            currency="USD",
+            location="Naples",
+            tags=["italian", "vegetarian", f"tag{i % 50}"],
+            avg_rating=round(1 + (i % 40) / 10, 2),
+            rating_count=i % 100,
+        ))
+    return repo
+
+
+def measure(client: TestClient, params: dict, headers: dict, requests: int) -> dict:
+    wire_bytes = 0
+    cpu_start = time.process_time()
+    for _ in range(requests):
+        response = client.get("/items", params=params, headers=headers)
+        response.raise_for_status()
+        wire_bytes = response.num_bytes_downloaded
+    cpu = time.process_time() - cpu_start
+    return {"wire_bytes": wire_bytes, "cpu_ms_per_request": cpu * 1000 / requests}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--per-page", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--json", dest="json_path", help="Also write results to this file for tracking")
+    args = parser.parse_args()
+
+    repo = build_repo(args.items)
+    app = create_app()
+    app.dependency_overrides[get_repository] = lambda: repo
+    client = TestClient(app)
+
+    identity = {"Accept-Encoding": "identity"}
+    gzip = {"Accept-Encoding": "gzip"}
+    page = {"per_page": args.per_page}
+    sparse = {**page, "fields": LIST_VIEW_FIELDS}
+    scenarios = {
+        "full": (page, identity),
+        "full+gzip": (page, gzip),
+        "sparse": (sparse, identity),
+        "sparse+gzip": (sparse, gzip),
+    }
+
+    results = {name: measure(client, params, headers, args.requests) for name, (params, headers) in scenarios.items()}
+    for name, r in results.items():
+        print(f"{name:12s} {r['wire_bytes']:8d} B  {r['cpu_ms_per_request']:7.3f} ms CPU/request")
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Cold-start benchmark: import time of src.api.main (which builds the app) and
+time to first response (health check and /openapi.json), each measured in a
+fresh interpreter so nothing is warm.
+
+Run from the BackendService directory (after `python -m src.api.generate_openapi`
+and with ENV=production to measure the prebuilt OpenAPI path):
+
+    ENV=production python -m benchmarks.bench_startup --runs 10 --json startup.json
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+_PROBE = r"""
+import json, time
+t0 = time.perf_counter()
+from src.api.main import app
+t1 = time.perf_counter()
+from fastapi.testclient import TestClient
+client = TestClient(app)
+t2 = time.perf_counter()
+client.get("/")
+t3 = time.perf_counter()
+client.get("/openapi.json")
+t4 = time.perf_counter()
+print(json.dumps({
+    "import_s": t1 - t0,
+    "first_response_s": t3 - t2,
+    "first_openapi_s": t4 - t3,
+    "time_to_first_response_s": (t1 - t0) + (t3 - t2),
+}))
+"""
+
+
+def run(runs: int) -> dict:
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", _PROBE], capture_output=True, text=True, check=True)
+        samples.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    return {key: statistics.median(s[key] for s in samples) for key in samples[0]}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to sample (median reported)")
+    parser.add_argument("--json", dest="json_path", help="Also write results to this file for tracking")
+    args = parser.parse_args()
+
+    results = run(args.runs)
+    for key, value in results.items():
+        print(f"{key:28s} {value * 1000:8.1f} ms")
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
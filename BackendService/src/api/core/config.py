@@ -13,6 +13,13 @@ class Settings(BaseSettings):
         default=["*"], description="Allowed CORS origins list"
     )
 
+    GZIP_MINIMUM_SIZE: int = Field(default=1024, description="Compress responses larger than this many bytes")
+    GZIP_COMPRESS_LEVEL: int = Field(default=6, ge=1, le=9, description="gzip compression level")
+    OPENAPI_CACHE_PATH: str | None = Field(
+        default="interfaces/openapi.json",
+        description="Prebuilt OpenAPI document served in production instead of generating it per worker (None to disable)",
+    )
+
     # Placeholders for future integration
     DATABASE_URL: str | None = Field(default=None, description="Database URL (optional, not used in mock repo)")
     AUTH_ISSUER: str | None = Field(default=None, description="Auth issuer (OIDC) - placeholder")
@@ -20,6 +27,10 @@ class Settings(BaseSettings):
     AUTH_JWKS_URL: str | None = Field(default=None, description="JWKS URL - placeholder")
     SECRET_KEY: str = Field(default="dev-secret", description="Secret key for mock token signing (dev only)")
 
+    # Change event streaming (SSE / WebSocket)
+    EVENTS_CLIENT_BUFFER: int = Field(default=256, description="Max buffered events per client; beyond it the oldest are dropped and a gap event is sent")
+    EVENTS_KEEPALIVE_SECONDS: float = Field(default=15.0, description="Idle seconds between SSE keepalive comments")
+
     class Config:
         env_file = ".env"
         extra = "ignore"
@@ -1,8 +1,10 @@
+from functools import lru_cache
 from typing import Optional
 from fastapi import Query, Depends
 from pydantic import BaseModel, Field
 
 from .security import mock_get_current_user_optional, mock_get_current_user_required, AuthUser
+from ..repositories.memory_repo import InMemoryRepository
 
 
 class PaginationParams(BaseModel):
@@ -17,6 +19,12 @@ class SortParams(BaseModel):
     sort_order: Optional[str] = Field(None, description="Sort order: asc|desc")
 
 
+@lru_cache()
+def get_repository() -> InMemoryRepository:
+    """Get the process-wide repository, so data, indexes and the change log persist across requests."""
+    return InMemoryRepository()
+
+
 def get_pagination(
     page: int = Query(1, ge=1, description="Page number (1-based)"),
     per_page: int = Query(10, ge=1, le=100, description="Items per page"),
@@ -26,7 +34,9 @@ def get_pagination(
 
 
 def get_sorting(
-    sort_by: Optional[str] = Query(None, description="Field to sort by"),
+    sort_by: Optional[str] = Query(
+        None, description="Field to sort by (name, price, avg_rating, created_at, relevance; relevance requires q)"
+    ),
     sort_order: Optional[str] = Query(None, pattern="^(asc|desc)$", description="Sort order (asc|desc)"),
 ) -> SortParams:
     """Get sorting parameters."""
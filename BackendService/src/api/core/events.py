@@ -0,0 +1,180 @@
+from __future__ import annotations
+import asyncio
+import json
+from collections import defaultdict, deque
+from dataclasses import asdict, is_dataclass
+from functools import lru_cache
+from itertools import count
+from typing import Any, AsyncIterator, Deque, Dict, Iterable, Optional, Set
+
+
+class ChangeEvent:
+    """
+    A change notification. The wire encodings are built once per event and shared
+    by every subscriber, however many there are.
+    """
+
+    __slots__ = ("seq", "type", "item_id", "category", "envelope", "sse")
+
+    def __init__(self, seq: int, type: str, item_id: Optional[str], category: Optional[str], data: Any):
+        if is_dataclass(data):
+            data = asdict(data)
+        self.seq = seq
+        self.type = type
+        self.item_id = item_id
+        self.category = category
+        self.envelope = json.dumps(
+            {"seq": seq, "type": type, "item_id": item_id, "category": category, "data": data},
+            default=str,
+            separators=(",", ":"),
+        )
+        self.sse = f"id: {seq}\nevent: {type}\ndata: {self.envelope}\n\n".encode()
+
+
+class Subscriber:
+    """
+    One connected client. Holds a bounded buffer; if the client falls behind and
+    the buffer fills, the oldest events are dropped and the next one read is a
+    "gap" event, so a slow client costs bounded memory and knows to refetch.
+    """
+
+    __slots__ = ("bus", "topics", "buffer", "capacity", "wakeup", "loop", "closed", "dropped", "last_dropped_seq")
+
+    def __init__(self, bus: EventBus, topics: Set[str], capacity: int):
+        self.bus = bus
+        self.topics = topics
+        self.buffer: Deque[ChangeEvent] = deque()
+        self.capacity = capacity
+        self.wakeup = asyncio.Event()
+        self.loop = asyncio.get_running_loop()
+        self.closed = False
+        self.dropped = 0
+        self.last_dropped_seq = 0
+
+    def _wake(self) -> None:
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self.loop:
+            self.wakeup.set()
+        else:
+            self.loop.call_soon_threadsafe(self.wakeup.set)
+
+    def push(self, event: ChangeEvent) -> None:
+        if self.closed:
+            return
+        if len(self.buffer) >= self.capacity:
+            self.dropped += 1
+            self.last_dropped_seq = self.buffer.popleft().seq
+        self.buffer.append(event)
+        self._wake()
+
+    def _gap(self) -> ChangeEvent:
+        # Carries the last lost seq, so an SSE client's Last-Event-ID moves past the gap.
+        event = ChangeEvent(self.last_dropped_seq, "gap", None, None, {"dropped": self.dropped})
+        self.dropped = 0
+        return event
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        self.bus.unsubscribe(self)
+        self._wake()
+
+    async def listen(self, keepalive: Optional[float] = None) -> AsyncIterator[Optional[ChangeEvent]]:
+        """
+        Yield buffered events until the subscriber is closed. When keepalive is
+        set, None is yielded after that many idle seconds.
+        """
+        try:
+            while True:
+                while self.buffer:
+                    if self.dropped:
+                        yield self._gap()
+                        continue
+                    yield self.buffer.popleft()
+                if self.closed:
+                    return
+                self.wakeup.clear()
+                try:
+                    await asyncio.wait_for(self.wakeup.wait(), keepalive)
+                except asyncio.TimeoutError:
+                    yield None
+        finally:
+            self.close()
+
+
+class EventBus:
+    """
+    In-process fan-out of repository change events to subscribers, keyed by topic
+    ("item:<id>" or "category:<name>"). Events with no subscribers are not serialized.
+    """
+
+    def __init__(self, buffer_size: int = 256):
+        self.buffer_size = buffer_size
+        self.topics: Dict[str, Set[Subscriber]] = defaultdict(set)
+        self._seq = count(1)
+
+    @staticmethod
+    def item_topic(item_id: str) -> str:
+        return f"item:{item_id}"
+
+    @staticmethod
+    def category_topic(category: str) -> str:
+        return f"category:{category.lower()}"
+
+    def subscribe(self, item_ids: Iterable[str] = (), categories: Iterable[str] = ()) -> Subscriber:
+        topics = {self.item_topic(i) for i in item_ids}
+        topics.update(self.category_topic(c) for c in categories)
+        subscriber = Subscriber(self, topics, self.buffer_size)
+        for topic in topics:
+            self.topics[topic].add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        for topic in subscriber.topics:
+            subscribers = self.topics.get(topic)
+            if subscribers is None:
+                continue
+            subscribers.discard(subscriber)
+            if not subscribers:
+                del self.topics[topic]
+
+    def _targets(self, item_ids: Iterable[str], categories: Iterable[str]) -> Set[Subscriber]:
+        targets: Set[Subscriber] = set()
+        for item_id in item_ids:
+            targets.update(self.topics.get(self.item_topic(item_id), ()))
+        for category in categories:
+            targets.update(self.topics.get(self.category_topic(category), ()))
+        return targets
+
+    def _deliver(self, targets: Set[Subscriber], type: str, item_id: Optional[str], category: Optional[str],
+                 data: Any) -> None:
+        if not targets:
+            return
+        event = ChangeEvent(next(self._seq), type, item_id, category, data)
+        for subscriber in targets:
+            subscriber.push(event)
+
+    def publish(self, type: str, item_id: Optional[str], category: Optional[str], data: Any) -> None:
+        """Deliver an event; data is a dict or a domain dataclass, serialized only if someone listens."""
+        targets = self._targets(
+            () if item_id is None else (item_id,),
+            () if category is None else (category,),
+        )
+        self._deliver(targets, type, item_id, category, data)
+
+    def publish_batch(self, type: str, item_ids: Iterable[str], categories: Iterable[str], data: Any) -> None:
+        """Deliver one event for a bulk change to every subscriber of any of the items or categories."""
+        self._deliver(self._targets(item_ids, categories), type, None, None, data)
+
+
+@lru_cache()
+def get_event_bus() -> EventBus:
+    """Get the process-wide event bus."""
+    # Imported here so repositories (which publish through the bus) do not load app settings on import.
+    from .config import get_settings
+
+    return EventBus(buffer_size=get_settings().EVENTS_CLIENT_BUFFER)
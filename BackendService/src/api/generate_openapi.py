@@ -1,15 +1,21 @@
 import json
 import os
 
-from src.api.main import app
+from src.api.core.config import get_settings
+from src.api.main import OPENAPI_FINGERPRINT_KEY, create_app, openapi_fingerprint
+
+# Build the app without the OpenAPI cache so the schema is generated from the routes
+settings = get_settings().model_copy(update={"OPENAPI_CACHE_PATH": None})
+app = create_app(settings)
 
 # Get the OpenAPI schema
-openapi_schema = app.openapi()
+openapi_schema = dict(app.openapi())
+# Lets the app detect a schema file built from different code
+openapi_schema[OPENAPI_FINGERPRINT_KEY] = openapi_fingerprint(app)
 
-# Write to file
-output_dir = "interfaces"
-os.makedirs(output_dir, exist_ok=True)
-output_path = os.path.join(output_dir, "openapi.json")
+# Write to file (served by the app at runtime, see Settings.OPENAPI_CACHE_PATH)
+output_path = get_settings().OPENAPI_CACHE_PATH or os.path.join("interfaces", "openapi.json")
+os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
 
 with open(output_path, "w") as f:
     json.dump(openapi_schema, f, indent=2)
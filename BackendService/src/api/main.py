@@ -1,50 +1,128 @@
+import hashlib
+import json
+import os
+from typing import Any, Callable, Dict, Optional
+
+import fastapi
+import pydantic
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+
+from .routes import items, ratings, feedback, admin, auth, events
+from .core.config import Settings, get_settings
+
+OPENAPI_TAGS = [
+    {"name": "health", "description": "Health check endpoints"},
+    {"name": "auth", "description": "Authentication (placeholder/mock) endpoints"},
+    {"name": "items", "description": "Food items browse/search/filter/sort and details"},
+    {"name": "ratings", "description": "User ratings for food items"},
+    {"name": "feedback", "description": "User feedback for food items"},
+    {"name": "admin", "description": "Admin/moderation and data management"},
+    {"name": "events", "description": "Live item, rating and feedback change streams (SSE/WebSocket)"},
+]
 
-from .routes import items, ratings, feedback, admin, auth
-from .core.config import get_settings
-
-# Initialize settings
-settings = get_settings()
-
-# Create FastAPI app with metadata and OpenAPI tags
-app = FastAPI(
-    title="Food Recipe Explorer - BackendService",
-    description=(
-        "Central API for browsing, searching, filtering, sorting food items, "
-        "handling ratings and feedback, with admin endpoints and auth integration points."
-    ),
-    version="1.0.0",
-    openapi_tags=[
-        {"name": "health", "description": "Health check endpoints"},
-        {"name": "auth", "description": "Authentication (placeholder/mock) endpoints"},
-        {"name": "items", "description": "Food items browse/search/filter/sort and details"},
-        {"name": "ratings", "description": "User ratings for food items"},
-        {"name": "feedback", "description": "User feedback for food items"},
-        {"name": "admin", "description": "Admin/moderation and data management"},
-    ],
-)
-
-# CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.CORS_ALLOW_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+
+OPENAPI_FINGERPRINT_KEY = "x-build-fingerprint"
+
+_API_DIR = os.path.dirname(os.path.abspath(__file__))
 
 
 # PUBLIC_INTERFACE
-@app.get("/", tags=["health"], summary="Health Check", operation_id="health_check")
-def health_check():
-    """Simple health check endpoint returning service status."""
-    return {"status": "healthy", "service": "backend", "version": settings.APP_VERSION}
-
-
-# Register routers
-app.include_router(auth.router, prefix="/auth", tags=["auth"])
-app.include_router(items.router, prefix="/items", tags=["items"])
-app.include_router(ratings.router, prefix="/ratings", tags=["ratings"])
-app.include_router(feedback.router, prefix="/feedback", tags=["feedback"])
-app.include_router(admin.router, prefix="/admin", tags=["admin"])
+def openapi_fingerprint(app: FastAPI) -> str:
+    """
+    Fingerprint of everything the OpenAPI document is built from: the app's title
+    and version, the API package sources (routes and schemas) and the FastAPI and
+    pydantic versions. Reading the sources is far cheaper than generating the schema.
+    """
+    digest = hashlib.sha256()
+    for part in (app.title, app.version, fastapi.__version__, pydantic.VERSION):
+        digest.update(f"{part}\n".encode())
+    for root, dirs, files in os.walk(_API_DIR):
+        dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+        for name in sorted(files):
+            if name.endswith(".py"):
+                path = os.path.join(root, name)
+                digest.update(os.path.relpath(path, _API_DIR).encode())
+                with open(path, "rb") as f:
+                    digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _cached_openapi(app: FastAPI, path: str) -> Callable[[], Dict[str, Any]]:
+    """
+    Serve the OpenAPI document prebuilt by generate_openapi instead of rebuilding
+    it in every worker. Falls back to generation if the file is missing or was
+    built from different code (see openapi_fingerprint).
+    """
+    generate = app.openapi
+
+    def openapi() -> Dict[str, Any]:
+        if app.openapi_schema is None:
+            try:
+                with open(path) as f:
+                    schema = json.load(f)
+            except (OSError, ValueError):
+                schema = None
+            if schema is not None and schema.get(OPENAPI_FINGERPRINT_KEY) == openapi_fingerprint(app):
+                app.openapi_schema = schema
+            else:
+                return generate()
+        return app.openapi_schema
+
+    return openapi
+
+
+# PUBLIC_INTERFACE
+def create_app(settings: Optional[Settings] = None) -> FastAPI:
+    """Build the FastAPI application."""
+    settings = settings or get_settings()
+
+    app = FastAPI(
+        title=settings.APP_NAME,
+        description=(
+            "Central API for browsing, searching, filtering, sorting food items, "
+            "handling ratings and feedback, with admin endpoints and auth integration points."
+        ),
+        version=settings.APP_VERSION,
+        openapi_tags=OPENAPI_TAGS,
+    )
+
+    # CORS
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.CORS_ALLOW_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    # gzip when the client sends Accept-Encoding: gzip (event streams are never compressed)
+    app.add_middleware(
+        GZipMiddleware,
+        minimum_size=settings.GZIP_MINIMUM_SIZE,
+        compresslevel=settings.GZIP_COMPRESS_LEVEL,
+    )
+
+    # PUBLIC_INTERFACE
+    @app.get("/", tags=["health"], summary="Health Check", operation_id="health_check")
+    def health_check():
+        """Simple health check endpoint returning service status."""
+        return {"status": "healthy", "service": "backend", "version": settings.APP_VERSION}
+
+    # Register routers
+    app.include_router(auth.router, prefix="/auth", tags=["auth"])
+    app.include_router(items.router, prefix="/items", tags=["items"])
+    app.include_router(ratings.router, prefix="/ratings", tags=["ratings"])
+    app.include_router(feedback.router, prefix="/feedback", tags=["feedback"])
+    app.include_router(admin.router, prefix="/admin", tags=["admin"])
+    app.include_router(events.router, prefix="/events", tags=["events"])
+
+    # Only in production: during development (e.g. --reload) routes change under a stale file.
+    if settings.ENV == "production" and settings.OPENAPI_CACHE_PATH and os.path.exists(settings.OPENAPI_CACHE_PATH):
+        app.openapi = _cached_openapi(app, settings.OPENAPI_CACHE_PATH)
+
+    return app
+
+
+app = create_app()
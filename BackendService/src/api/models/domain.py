@@ -38,3 +38,20 @@ class Feedback:
     status: str = "pending"  # pending | approved | rejected
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
+
+
+@dataclass
+class ItemChange:
+    seq: int
+    item_id: str
+    deleted: bool
+    item: Optional[FoodItem] = None
+
+
+@dataclass
+class ChangeFeed:
+    changes: List[ItemChange]
+    next_since: int
+    current_seq: int
+    has_more: bool = False
+    resync: bool = False  # cursor expired (or unknown); client must re-download the catalog
@@ -1,9 +1,25 @@
 from __future__ import annotations
-from typing import Dict, List, Optional, Iterable, Callable
+from bisect import bisect_right
+from collections import defaultdict
+from itertools import islice
+from typing import Dict, List, Optional, Iterable, Callable, Tuple
 from uuid import uuid4
-from datetime import datetime
+from datetime import datetime, timezone
 
-from ..models.domain import FoodItem, Rating, Feedback
+from ..core.events import EventBus, get_event_bus
+from ..models.domain import FoodItem, Rating, Feedback, ItemChange, ChangeFeed
+from .search_index import BM25Index, TrigramIndex, tokenize
+from .similarity_index import MinHashLSH
+from .trending_index import TrendingIndex
+
+
+def _utc_timestamp(moment: Optional[datetime] = None) -> float:
+    """POSIX timestamp; naive datetimes (the domain models use utcnow) are read as UTC, not local time."""
+    if moment is None:
+        return datetime.now(timezone.utc).timestamp()
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
 
 
 class InMemoryRepository:
@@ -12,13 +28,34 @@ class InMemoryRepository:
     Thread-safety is not addressed for simplicity in this mock.
     """
 
-    def __init__(self):
+    # Deletion tombstones kept for delta sync; older ones are purged and expire cursors.
+    CHANGELOG_MAX_TOMBSTONES = 10_000
+
+    def __init__(self, events: Optional[EventBus] = None):
+        self.events: Optional[EventBus] = None
         self.items: Dict[str, FoodItem] = {}
         self.ratings: Dict[str, Rating] = {}
         self.feedbacks: Dict[str, Feedback] = {}
+        # Moderation queue: status -> feedback ids in the order they entered that
+        # status (dicts used as ordered sets for O(1) moves), so pending is oldest first.
+        self.feedback_by_status: Dict[str, Dict[str, None]] = defaultdict(dict)
+        self.trigram_index = TrigramIndex()
+        self.bm25_index = BM25Index()
+        self.similarity_index = MinHashLSH()
+        self.trending_index = TrendingIndex(origin=_utc_timestamp())
+        # Delta-sync change log: parallel (seq, item id) lists in seq order. An entry is
+        # live only while it is its item's latest change; dead entries are compacted away.
+        self.change_seq = 0
+        self.min_change_seq = 0
+        self.change_log_seqs: List[int] = []
+        self.change_log_ids: List[str] = []
+        self.latest_change: Dict[str, int] = {}
+        self.tombstones: Dict[str, int] = {}
+        self._dead_changes = 0
 
-        # Seed with example items
+        # Seed with example items (before attaching the bus, so seeding emits no events)
         self._seed_items()
+        self.events = events if events is not None else get_event_bus()
 
     def _seed_items(self):
         seed = [
@@ -60,11 +97,72 @@ class InMemoryRepository:
             ),
         ]
         for s in seed:
-            self.items[s.id] = s
+            self.create_item(s)
+
+    def _publish(self, type: str, item_id: Optional[str], category: Optional[str], data) -> None:
+        if self.events is not None:
+            self.events.publish(type, item_id, category, data)
+
+    def _record_change(self, item_id: str, deleted: bool = False) -> None:
+        self.change_seq += 1
+        seq = self.change_seq
+        if item_id in self.latest_change:
+            self._dead_changes += 1
+        self.change_log_seqs.append(seq)
+        self.change_log_ids.append(item_id)
+        self.latest_change[item_id] = seq
+        self.tombstones.pop(item_id, None)
+        if deleted:
+            self.tombstones[item_id] = seq
+            while len(self.tombstones) > self.CHANGELOG_MAX_TOMBSTONES:
+                oldest_id = next(iter(self.tombstones))
+                oldest_seq = self.tombstones.pop(oldest_id)
+                del self.latest_change[oldest_id]
+                self._dead_changes += 1
+                # Cursors before this point could miss the purged deletion.
+                self.min_change_seq = oldest_seq
+        if self._dead_changes > 1024 and self._dead_changes * 2 > len(self.change_log_seqs):
+            self._compact_changes()
+
+    def _compact_changes(self) -> None:
+        live = [
+            (seq, item_id)
+            for seq, item_id in zip(self.change_log_seqs, self.change_log_ids)
+            if self.latest_change.get(item_id) == seq
+        ]
+        self.change_log_seqs = [seq for seq, _ in live]
+        self.change_log_ids = [item_id for _, item_id in live]
+        self._dead_changes = 0
+
+    def changes_since(self, since: int, limit: int) -> ChangeFeed:
+        """Latest change per item after the since cursor, in seq order, at most limit entries."""
+        if since < self.min_change_seq or since > self.change_seq:
+            return ChangeFeed(changes=[], next_since=self.change_seq, current_seq=self.change_seq, resync=True)
+        changes: List[ItemChange] = []
+        next_since = since
+        i = bisect_right(self.change_log_seqs, since)
+        end = len(self.change_log_seqs)
+        while i < end and len(changes) < limit:
+            seq, item_id = self.change_log_seqs[i], self.change_log_ids[i]
+            if self.latest_change.get(item_id) == seq:
+                item = self.items.get(item_id)
+                changes.append(ItemChange(seq=seq, item_id=item_id, deleted=item is None, item=item))
+            next_since = seq
+            i += 1
+        # Step over superseded entries so has_more never promises an empty page.
+        while i < end and self.latest_change.get(self.change_log_ids[i]) != self.change_log_seqs[i]:
+            next_since = self.change_log_seqs[i]
+            i += 1
+        return ChangeFeed(changes=changes, next_since=next_since, current_seq=self.change_seq, has_more=i < end)
 
     # FoodItem operations
     def create_item(self, item: FoodItem) -> FoodItem:
         self.items[item.id] = item
+        self.trigram_index.add(item)
+        self.bm25_index.add(item)
+        self.similarity_index.set_tags(item.id, item.tags)
+        self._record_change(item.id)
+        self._publish("item.created", item.id, item.category, item)
         return item
 
     def update_item(self, item_id: str, mutator: Callable[[FoodItem], None]) -> Optional[FoodItem]:
@@ -73,14 +171,41 @@ class InMemoryRepository:
             return None
         mutator(item)
         item.updated_at = datetime.utcnow()
+        self.trigram_index.reindex(item)
+        self.bm25_index.reindex(item)
+        self.similarity_index.set_tags(item.id, item.tags)
+        self.trending_index.set_category(item.id, item.category)
+        self._record_change(item.id)
+        self._publish("item.updated", item.id, item.category, item)
         return item
 
     def delete_item(self, item_id: str) -> bool:
-        return self.items.pop(item_id, None) is not None
+        item = self.items.pop(item_id, None)
+        if item is None:
+            return False
+        self.trigram_index.remove(item_id)
+        self.bm25_index.remove(item_id)
+        self.similarity_index.remove(item_id)
+        self.trending_index.remove(item_id)
+        self._record_change(item_id, deleted=True)
+        self._publish("item.deleted", item_id, item.category, {"id": item_id})
+        return True
 
     def get_item(self, item_id: str) -> Optional[FoodItem]:
         return self.items.get(item_id)
 
+    def get_items(self, item_ids: Iterable[str]) -> Tuple[List[FoodItem], List[str]]:
+        """Look up many items at once; returns (found items in request order, missing ids)."""
+        found: List[FoodItem] = []
+        missing: List[str] = []
+        for item_id in dict.fromkeys(item_ids):
+            item = self.items.get(item_id)
+            if item is None:
+                missing.append(item_id)
+            else:
+                found.append(item)
+        return found, missing
+
     def list_items(self) -> Iterable[FoodItem]:
         return list(self.items.values())
 
@@ -94,31 +219,107 @@ class InMemoryRepository:
             item.rating_count += 1
             item.avg_rating = round(total_score / item.rating_count, 2)
             item.updated_at = datetime.utcnow()
+            self.similarity_index.add_rater(item.id, rating.user_id)
+            self.trending_index.record(item.id, item.category, _utc_timestamp(rating.created_at))
+            self._record_change(item.id)
+            self._publish(
+                "rating.added",
+                item.id,
+                item.category,
+                {"item_id": item.id, "score": rating.score, "avg_rating": item.avg_rating,
+                 "rating_count": item.rating_count},
+            )
         return rating
 
+    def similar_items(self, item_id: str, limit: int) -> Optional[List[Tuple[FoodItem, float]]]:
+        """Items most similar to item_id by tags and shared raters; None if the item does not exist."""
+        if item_id not in self.items:
+            return None
+        return [(self.items[other], score) for other, score in self.similarity_index.similar(item_id, limit)]
+
+    def trending_items(
+        self, window: str, limit: int, category: Optional[str] = None
+    ) -> List[Tuple[FoodItem, float]]:
+        """Items with the highest time-decayed rating counts in the window, hottest first."""
+        now = _utc_timestamp()
+        ranked = self.trending_index.trending(window, now, limit, category)
+        return [(self.items[item_id], score) for item_id, score in ranked]
+
     def list_ratings_for_item(self, item_id: str) -> List[Rating]:
         return [r for r in self.ratings.values() if r.item_id == item_id]
 
     # Feedback operations
     def add_feedback(self, feedback: Feedback) -> Feedback:
         self.feedbacks[feedback.id] = feedback
+        self.feedback_by_status[feedback.status][feedback.id] = None
         return feedback
 
     def list_feedback_for_item(self, item_id: str) -> List[Feedback]:
         return [f for f in self.feedbacks.values() if f.item_id == item_id]
 
+    def list_feedback_by_status(self, status: str, offset: int, limit: int) -> Tuple[List[Feedback], int]:
+        ids = self.feedback_by_status.get(status, {})
+        page = islice(ids, offset, offset + limit)
+        return [self.feedbacks[fid] for fid in page], len(ids)
+
+    def _move_feedback_status(self, fb: Feedback, status: str, now: datetime) -> bool:
+        """Move fb to status; returns False, changing nothing, if it already has it."""
+        if fb.status == status:
+            return False
+        self.feedback_by_status[fb.status].pop(fb.id, None)
+        self.feedback_by_status[status][fb.id] = None
+        fb.status = status
+        fb.updated_at = now
+        return True
+
+    def _item_category(self, item_id: str) -> Optional[str]:
+        item = self.items.get(item_id)
+        return item.category if item else None
+
     def set_feedback_status(self, feedback_id: str, status: str) -> Optional[Feedback]:
         fb = self.feedbacks.get(feedback_id)
         if not fb:
             return None
-        fb.status = status
-        fb.updated_at = datetime.utcnow()
+        if self._move_feedback_status(fb, status, datetime.utcnow()):
+            self._publish(
+                "feedback.status",
+                fb.item_id,
+                self._item_category(fb.item_id),
+                {"id": fb.id, "item_id": fb.item_id, "status": fb.status},
+            )
         return fb
 
+    def set_feedback_status_many(self, feedback_ids: Iterable[str], status: str) -> Tuple[List[Feedback], List[str]]:
+        """
+        Set the status of many feedback records at once; returns (updated, missing ids).
+        Subscribers get one feedback.status.batch event listing the records that changed.
+        """
+        now = datetime.utcnow()
+        updated: List[Feedback] = []
+        missing: List[str] = []
+        changed: List[Feedback] = []
+        for feedback_id in dict.fromkeys(feedback_ids):
+            fb = self.feedbacks.get(feedback_id)
+            if not fb:
+                missing.append(feedback_id)
+                continue
+            if self._move_feedback_status(fb, status, now):
+                changed.append(fb)
+            updated.append(fb)
+        if changed and self.events is not None:
+            item_ids = {fb.item_id for fb in changed}
+            categories = {c for c in map(self._item_category, item_ids) if c is not None}
+            self.events.publish_batch(
+                "feedback.status.batch",
+                item_ids,
+                categories,
+                {"status": status, "feedback": [{"id": fb.id, "item_id": fb.item_id} for fb in changed]},
+            )
+        return updated, missing
+
     # Query utilities
-    def query_items(
-        self,
-        q: Optional[str] = None,
+    @staticmethod
+    def _item_filter(
         category: Optional[str] = None,
         location: Optional[str] = None,
         min_price: Optional[float] = None,
@@ -126,20 +327,11 @@ class InMemoryRepository:
         min_rating: Optional[float] = None,
         max_rating: Optional[float] = None,
         tags: Optional[List[str]] = None,
-        sort_by: Optional[str] = None,
-        sort_order: Optional[str] = None,
-    ) -> List[FoodItem]:
-        items = list(self.items.values())
+    ) -> Callable[[FoodItem], bool]:
+        """Build a predicate for the non-text filters of an item query."""
+        wanted_tags = set(tag.lower() for tag in tags) if tags else None
 
         def matches(item: FoodItem) -> bool:
-            if q:
-                ql = q.lower()
-                if not (
-                    ql in item.name.lower()
-                    or ql in item.description.lower()
-                    or any(ql in t.lower() for t in item.tags)
-                ):
-                    return False
             if category and item.category.lower() != category.lower():
                 return False
             if location and item.location.lower() != location.lower():
@@ -152,22 +344,117 @@ class InMemoryRepository:
                 return False
             if max_rating is not None and item.avg_rating > max_rating:
                 return False
-            if tags and not set(tag.lower() for tag in tags).issubset(set(t.lower() for t in item.tags)):
+            if wanted_tags and not wanted_tags.issubset(set(t.lower() for t in item.tags)):
                 return False
             return True
 
-        filtered = [i for i in items if matches(i)]
+        return matches
+
+    def _match_items(
+        self,
+        q: Optional[str] = None,
+        category: Optional[str] = None,
+        location: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        min_rating: Optional[float] = None,
+        max_rating: Optional[float] = None,
+        tags: Optional[List[str]] = None,
+        fuzzy: bool = False,
+    ) -> Tuple[List[FoodItem], Optional[Dict[str, int]]]:
+        """Unordered items matching a query, and their fuzzy edit distances (None unless fuzzy)."""
+        items = list(self.items.values())
+        distances: Optional[Dict[str, int]] = None
+        if q and fuzzy:
+            # Typo-tolerant search: candidates come from the trigram index, so
+            # only matching items are filtered instead of the whole catalog.
+            distances = self.trigram_index.search(q)
+            if distances is not None:
+                items = [self.items[i] for i in distances]
+
+        passes_filters = self._item_filter(category, location, min_price, max_price, min_rating, max_rating, tags)
+
+        def matches(item: FoodItem) -> bool:
+            if q and distances is None:
+                ql = q.lower()
+                if not (
+                    ql in item.name.lower()
+                    or ql in item.description.lower()
+                    or any(ql in t.lower() for t in item.tags)
+                ):
+                    return False
+            return passes_filters(item)
+
+        return [i for i in items if matches(i)], distances
+
+    def query_items(
+        self,
+        q: Optional[str] = None,
+        category: Optional[str] = None,
+        location: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        min_rating: Optional[float] = None,
+        max_rating: Optional[float] = None,
+        tags: Optional[List[str]] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        fuzzy: bool = False,
+    ) -> List[FoodItem]:
+        filtered, distances = self._match_items(
+            q, category, location, min_price, max_price, min_rating, max_rating, tags, fuzzy
+        )
 
-        if sort_by:
+        key_map = {
+            "name": lambda x: x.name.lower(),
+            "price": lambda x: x.price,
+            "avg_rating": lambda x: x.avg_rating,
+            "created_at": lambda x: x.created_at,
+        }
+        key_fn = key_map.get(sort_by) if sort_by else None
+        if key_fn:
             reverse = (sort_order or "asc").lower() == "desc"
-            key_map = {
-                "name": lambda x: x.name.lower(),
-                "price": lambda x: x.price,
-                "avg_rating": lambda x: x.avg_rating,
-                "created_at": lambda x: x.created_at,
-            }
-            key_fn = key_map.get(sort_by)
-            if key_fn:
-                filtered.sort(key=key_fn, reverse=reverse)
+            filtered.sort(key=key_fn, reverse=reverse)
+        elif distances is not None:
+            # Closest matches first; only the filtered hits are sorted.
+            filtered.sort(key=lambda x: (distances[x.id], x.name.lower()))
 
         return filtered
+
+    def rank_items(
+        self,
+        q: str,
+        offset: int,
+        limit: int,
+        category: Optional[str] = None,
+        location: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        min_rating: Optional[float] = None,
+        max_rating: Optional[float] = None,
+        tags: Optional[List[str]] = None,
+        fuzzy: bool = False,
+    ) -> Tuple[List[FoodItem], int]:
+        """
+        BM25-ranked search returning one page of results and the total match count.
+        Matching is _match_items, as for query_items (so totals do not depend on the
+        sort mode); only the order differs. Scoring is document-at-a-time with
+        max-score pruning against the current top offset + limit, so most matches
+        are never fully scored.
+        """
+        matched, _ = self._match_items(
+            q, category, location, min_price, max_price, min_rating, max_rating, tags, fuzzy
+        )
+
+        term_weights: Dict[str, float] = {}
+        for word in tokenize(q):
+            if fuzzy:
+                # Expand to typo variants, discounting by edit distance.
+                for variant, dist in self.trigram_index.similar_words(word).items():
+                    weight = 1.0 / (1 + dist)
+                    term_weights[variant] = max(term_weights.get(variant, 0.0), weight)
+            else:
+                term_weights[word] = 1.0
+
+        top = self.bm25_index.top_k(term_weights, [item.id for item in matched], offset + limit)
+        return [self.items[item_id] for item_id, _ in top[offset:]], len(matched)
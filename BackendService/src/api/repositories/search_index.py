@@ -0,0 +1,334 @@
+from __future__ import annotations
+import heapq
+import math
+import re
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+from ..models.domain import FoodItem
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def item_words(item: FoodItem) -> Set[str]:
+    """Distinct searchable words of an item (name, description and tags)."""
+    words = set(tokenize(item.name))
+    words.update(tokenize(item.description))
+    for tag in item.tags:
+        words.update(tokenize(tag))
+    return words
+
+
+def trigrams(word: str) -> Set[str]:
+    """Padded character trigrams of a word ("  ab " style padding as in pg_trgm)."""
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+# Query words at least this long also match vocabulary words they are a prefix of ("choc" -> "chocolate").
+MIN_PREFIX_LENGTH = 3
+
+
+def max_edits_for(word: str) -> int:
+    """Edit budget allowed for a query word; short words must match exactly."""
+    if len(word) <= 3:
+        return 0
+    if len(word) <= 7:
+        return 1
+    return 2
+
+
+def bounded_levenshtein(a: str, b: str, max_dist: int) -> int:
+    """
+    Levenshtein distance between a and b, giving up early once it is certain
+    to exceed max_dist. Returns max_dist + 1 in that case.
+    """
+    if abs(len(a) - len(b)) > max_dist:
+        return max_dist + 1
+    if len(a) > len(b):
+        a, b = b, a
+    previous = list(range(len(a) + 1))
+    for j, cb in enumerate(b, start=1):
+        current = [j] + [0] * len(a)
+        row_min = j
+        for i, ca in enumerate(a, start=1):
+            cost = 0 if ca == cb else 1
+            current[i] = min(previous[i] + 1, current[i - 1] + 1, previous[i - 1] + cost)
+            if current[i] < row_min:
+                row_min = current[i]
+        if row_min > max_dist:
+            return max_dist + 1
+        previous = current
+    return min(previous[-1], max_dist + 1)
+
+
+class TrigramIndex:
+    """
+    Character-trigram index over the vocabulary of item words.
+
+    Trigrams point at distinct words rather than at items, so typo lookups only
+    touch the (much smaller) vocabulary; matched words are then expanded to
+    items through the word postings.
+    """
+
+    def __init__(self):
+        self.word_items: Dict[str, Set[str]] = defaultdict(set)
+        self.gram_words: Dict[str, Set[str]] = defaultdict(set)
+        self.item_words: Dict[str, Set[str]] = {}
+
+    def add(self, item: FoodItem) -> None:
+        words = item_words(item)
+        self.item_words[item.id] = words
+        for word in words:
+            postings = self.word_items[word]
+            if not postings:
+                for gram in trigrams(word):
+                    self.gram_words[gram].add(word)
+            postings.add(item.id)
+
+    def remove(self, item_id: str) -> None:
+        for word in self.item_words.pop(item_id, ()):
+            postings = self.word_items.get(word)
+            if postings is None:
+                continue
+            postings.discard(item_id)
+            if not postings:
+                del self.word_items[word]
+                for gram in trigrams(word):
+                    words = self.gram_words.get(gram)
+                    if words is not None:
+                        words.discard(word)
+                        if not words:
+                            del self.gram_words[gram]
+
+    def reindex(self, item: FoodItem) -> None:
+        self.remove(item.id)
+        self.add(item)
+
+    def _prefixed_words(self, prefix: str) -> Set[str]:
+        """Vocabulary words starting with prefix, found by intersecting its leading trigrams."""
+        padded = f"  {prefix}"
+        postings = sorted(
+            (self.gram_words.get(padded[i:i + 3], set()) for i in range(len(prefix))),
+            key=len,
+        )
+        if not postings or not postings[0]:
+            return set()
+        candidates = set(postings[0])
+        for words in postings[1:]:
+            candidates &= words
+            if not candidates:
+                break
+        return {w for w in candidates if w.startswith(prefix)}
+
+    def similar_words(self, word: str) -> Dict[str, int]:
+        """
+        Vocabulary words within the edit budget of word, or starting with it, mapped
+        to their distance (a longer word matched only as a prefix counts as one edit).
+        """
+        max_dist = max_edits_for(word)
+        matches: Dict[str, int] = {}
+        if max_dist == 0:
+            if word in self.word_items:
+                matches[word] = 0
+        else:
+            grams = trigrams(word)
+            # q-gram lemma: each edit destroys at most three trigrams.
+            min_shared = max(1, len(grams) - 3 * max_dist)
+            shared: Dict[str, int] = defaultdict(int)
+            for gram in grams:
+                for candidate in self.gram_words.get(gram, ()):
+                    shared[candidate] += 1
+
+            for candidate, count in shared.items():
+                if count < min_shared or abs(len(candidate) - len(word)) > max_dist:
+                    continue
+                dist = bounded_levenshtein(word, candidate, max_dist)
+                if dist <= max_dist:
+                    matches[candidate] = dist
+
+        if len(word) >= MIN_PREFIX_LENGTH:
+            for candidate in self._prefixed_words(word):
+                matches.setdefault(candidate, 1)
+        return matches
+
+    def search(self, q: str) -> Optional[Dict[str, int]]:
+        """
+        Items whose words fuzzily (or by prefix) match every word of q, mapped to the summed
+        edit distance of the best match per query word. Returns None when q
+        has no searchable words.
+        """
+        query_words = tokenize(q)
+        if not query_words:
+            return None
+
+        result: Optional[Dict[str, int]] = None
+        for qw in dict.fromkeys(query_words):
+            hits: Dict[str, int] = {}
+            for word, dist in self.similar_words(qw).items():
+                for item_id in self.word_items.get(word, ()):
+                    if result is not None and item_id not in result:
+                        continue
+                    best = hits.get(item_id)
+                    if best is None or dist < best:
+                        hits[item_id] = dist
+            if result is None:
+                result = hits
+            else:
+                result = {item_id: result[item_id] + dist for item_id, dist in hits.items()}
+            if not result:
+                break
+        return result
+
+
+class BM25Index:
+    """
+    Incrementally maintained BM25 statistics over item name, description and tags.
+
+    Field term frequencies are combined BM25F-style with per-field weights so a
+    match in the name counts more than one in the description. Postings, document
+    frequencies and lengths are updated on add/remove, so nothing is recomputed
+    per query.
+    """
+
+    FIELD_WEIGHTS = {"name": 3.0, "tags": 2.0, "description": 1.0}
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self):
+        self.postings: Dict[str, Dict[str, float]] = defaultdict(dict)
+        self.doc_terms: Dict[str, List[str]] = {}
+        self.doc_lengths: Dict[str, float] = {}
+        self.total_length = 0.0
+        # Bounds for max-score pruning. They are only ever loosened (never tightened on
+        # removal), so they stay valid without rescanning postings.
+        self.max_freq: Dict[str, float] = {}
+        self.min_length = math.inf
+
+    def _term_frequencies(self, item: FoodItem) -> Dict[str, float]:
+        tf: Dict[str, float] = defaultdict(float)
+        weights = self.FIELD_WEIGHTS
+        for token in tokenize(item.name):
+            tf[token] += weights["name"]
+        for token in tokenize(item.description):
+            tf[token] += weights["description"]
+        for tag in item.tags:
+            for token in tokenize(tag):
+                tf[token] += weights["tags"]
+        return tf
+
+    def add(self, item: FoodItem) -> None:
+        tf = self._term_frequencies(item)
+        length = sum(tf.values())
+        self.doc_terms[item.id] = list(tf)
+        self.doc_lengths[item.id] = length
+        self.total_length += length
+        self.min_length = min(self.min_length, length)
+        max_freq = self.max_freq
+        for term, freq in tf.items():
+            self.postings[term][item.id] = freq
+            if freq > max_freq.get(term, 0.0):
+                max_freq[term] = freq
+
+    def remove(self, item_id: str) -> None:
+        terms = self.doc_terms.pop(item_id, None)
+        if terms is None:
+            return
+        self.total_length -= self.doc_lengths.pop(item_id)
+        for term in terms:
+            docs = self.postings.get(term)
+            if docs is None:
+                continue
+            docs.pop(item_id, None)
+            if not docs:
+                del self.postings[term]
+                self.max_freq.pop(term, None)
+
+    def reindex(self, item: FoodItem) -> None:
+        self.remove(item.id)
+        self.add(item)
+
+    def idf(self, term: str) -> float:
+        n = len(self.doc_lengths)
+        df = len(self.postings.get(term, ()))
+        return math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+
+    def top_k(self, term_weights: Dict[str, float], doc_ids: List[str], k: int) -> List[Tuple[str, float]]:
+        """
+        The k best (doc id, BM25 score) among doc_ids, best first; ties keep doc_ids order.
+
+        Document-at-a-time with max-score pruning: each query term has an upper
+        bound on what it can add to any document (from its largest term frequency
+        and the shortest document length). Terms are visited by decreasing bound,
+        and a document is abandoned once its partial score plus the bounds of the
+        terms left cannot beat the current k-th best; once no document can beat
+        it at all, the scan stops.
+        """
+        if k <= 0 or not self.doc_lengths:
+            return []
+        k1, b = self.K1, self.B
+        avgdl = self.total_length / len(self.doc_lengths) or 1.0
+        # BM25 term score is idf * freq * (k1 + 1) / (freq + base + scale * doc_length);
+        # the constant (k1 + 1) is applied once at the end.
+        base = k1 * (1.0 - b)
+        scale = k1 * b / avgdl
+        shortest = base + scale * self.min_length
+        lengths = self.doc_lengths
+
+        terms = []
+        for term, weight in term_weights.items():
+            docs = self.postings.get(term)
+            if docs:
+                idf = self.idf(term) * weight
+                top_freq = self.max_freq[term]
+                terms.append((idf * top_freq / (top_freq + shortest), idf, docs))
+        if not terms:
+            # Nothing can score: keep the first k matches in their given order.
+            return [(doc_id, 0.0) for doc_id in doc_ids[:k]]
+        terms.sort(key=lambda t: t[0], reverse=True)
+        # remaining[i]: best score still obtainable from terms[i:]
+        remaining = [0.0] * (len(terms) + 1)
+        for i in range(len(terms) - 1, -1, -1):
+            remaining[i] = remaining[i + 1] + terms[i][0]
+        best_possible = remaining[0]
+        scored = [(idf, docs, remaining[i + 1]) for i, (_, idf, docs) in enumerate(terms)]
+
+        heap: List[Tuple[float, int, str]] = []  # min-heap of (score, -position, doc id)
+        position = 0
+        for position, doc_id in enumerate(doc_ids):
+            if len(heap) >= k:
+                break
+            norm = base + scale * lengths[doc_id]
+            score = 0.0
+            for idf, docs, _ in scored:
+                freq = docs.get(doc_id)
+                if freq:
+                    score += idf * freq / (freq + norm)
+            heapq.heappush(heap, (score, -position, doc_id))
+        else:
+            position = len(doc_ids)
+
+        threshold = heap[0][0] if heap else 0.0
+        for position in range(position, len(doc_ids)):
+            if best_possible <= threshold:
+                break
+            doc_id = doc_ids[position]
+            norm = base + scale * lengths[doc_id]
+            score = 0.0
+            for idf, docs, rest in scored:
+                freq = docs.get(doc_id)
+                if freq:
+                    score += idf * freq / (freq + norm)
+                elif score + rest <= threshold:
+                    break
+            else:
+                if score > threshold:
+                    heapq.heapreplace(heap, (score, -position, doc_id))
+                    threshold = heap[0][0]
+        k1p = k1 + 1.0
+        return [(doc_id, score * k1p) for score, _, doc_id in sorted(heap, reverse=True)]
@@ -0,0 +1,157 @@
+from __future__ import annotations
+import hashlib
+import heapq
+import random
+from collections import defaultdict
+from typing import Dict, Iterable, List, Set, Tuple
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_EMPTY = _MAX_HASH + 1  # signature slot value before any feature is added
+
+# Hash permutations (a, b), drawn once per process from a fixed seed and shared by every index.
+_PERM_RNG = random.Random(1)
+_PERMS: List[Tuple[int, int]] = []
+
+
+def _permutations(num_perm: int) -> List[Tuple[int, int]]:
+    while len(_PERMS) < num_perm:
+        _PERMS.append((_PERM_RNG.randrange(1, _MERSENNE_PRIME), _PERM_RNG.randrange(0, _MERSENNE_PRIME)))
+    return _PERMS[:num_perm]
+
+
+def _feature_hash(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "big")
+
+
+class MinHashLSH:
+    """
+    MinHash signatures over item features (tags and the set of users who rated
+    the item) with banded locality-sensitive hashing for candidate lookup.
+
+    Adding a feature updates a signature in O(num_perm); replacing tags recomputes
+    it from the stored feature set. Top-k neighbours are cached per item and
+    invalidated when the item, or an item near it, changes. Lookups examine at
+    most max_candidates bucket members, so latency does not grow with the catalog.
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, max_candidates: int = 500, cache_size: int = 50):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.max_candidates = max_candidates
+        self.cache_size = cache_size
+        self._perms = _permutations(num_perm)
+
+        self.tags: Dict[str, Set[str]] = {}
+        self.raters: Dict[str, Set[str]] = defaultdict(set)
+        self.signatures: Dict[str, List[int]] = {}
+        self.item_buckets: Dict[str, List[Tuple[int, Tuple[int, ...]]]] = {}
+        self.buckets: Dict[Tuple[int, Tuple[int, ...]], Set[str]] = defaultdict(set)
+        # item -> cached [(neighbour, similarity)], and neighbour -> items whose cache mentions it
+        self.cache: Dict[str, List[Tuple[str, float]]] = {}
+        self.cited_by: Dict[str, Set[str]] = defaultdict(set)
+
+    def _hashes(self, feature: str) -> List[int]:
+        x = _feature_hash(feature)
+        return [((a * x + b) % _MERSENNE_PRIME) & _MAX_HASH for a, b in self._perms]
+
+    def _features(self, item_id: str) -> Iterable[str]:
+        for tag in self.tags.get(item_id, ()):
+            yield f"t:{tag}"
+        for user_id in self.raters.get(item_id, ()):
+            yield f"u:{user_id}"
+
+    def _set_signature(self, item_id: str, signature: List[int]) -> None:
+        self._unbucket(item_id)
+        self.signatures[item_id] = signature
+        if signature[0] == _EMPTY:
+            # No features yet: keep it out of the buckets, where it would collide with every other empty item.
+            self.item_buckets[item_id] = []
+        else:
+            keys = [(band, tuple(signature[band * self.rows:(band + 1) * self.rows])) for band in range(self.bands)]
+            for key in keys:
+                self.buckets[key].add(item_id)
+            self.item_buckets[item_id] = keys
+        self._invalidate(item_id)
+
+    def _unbucket(self, item_id: str) -> None:
+        for key in self.item_buckets.pop(item_id, ()):
+            members = self.buckets.get(key)
+            if members is not None:
+                members.discard(item_id)
+                if not members:
+                    del self.buckets[key]
+
+    def _invalidate(self, item_id: str) -> None:
+        for owner in self.cited_by.pop(item_id, ()):
+            self._drop_cache(owner)
+        self._drop_cache(item_id)
+        for other in self._candidates(item_id):
+            self._drop_cache(other)
+
+    def _drop_cache(self, item_id: str) -> None:
+        for neighbour, _ in self.cache.pop(item_id, ()):
+            owners = self.cited_by.get(neighbour)
+            if owners is not None:
+                owners.discard(item_id)
+
+    def _recompute(self, item_id: str) -> None:
+        signature = [_EMPTY] * self.num_perm
+        for feature in self._features(item_id):
+            signature = [min(s, h) for s, h in zip(signature, self._hashes(feature))]
+        self._set_signature(item_id, signature)
+
+    def set_tags(self, item_id: str, tags: Iterable[str]) -> None:
+        new_tags = {t.lower() for t in tags}
+        if self.tags.get(item_id) == new_tags and item_id in self.signatures:
+            return
+        self.tags[item_id] = new_tags
+        self._recompute(item_id)
+
+    def add_rater(self, item_id: str, user_id: str) -> None:
+        if item_id not in self.signatures or user_id in self.raters[item_id]:
+            return
+        self.raters[item_id].add(user_id)
+        current = self.signatures[item_id]
+        signature = [min(s, h) for s, h in zip(current, self._hashes(f"u:{user_id}"))]
+        if signature != current:
+            self._set_signature(item_id, signature)
+
+    def remove(self, item_id: str) -> None:
+        if item_id not in self.signatures:
+            return
+        self._invalidate(item_id)
+        self._unbucket(item_id)
+        del self.signatures[item_id]
+        self.tags.pop(item_id, None)
+        self.raters.pop(item_id, None)
+
+    def _candidates(self, item_id: str) -> Set[str]:
+        found: Set[str] = set()
+        for key in self.item_buckets.get(item_id, ()):
+            for other in self.buckets.get(key, ()):
+                if other != item_id:
+                    found.add(other)
+                    if len(found) >= self.max_candidates:
+                        return found
+        return found
+
+    def similar(self, item_id: str, limit: int) -> List[Tuple[str, float]]:
+        """Up to limit (neighbour id, estimated Jaccard similarity), most similar first."""
+        cached = self.cache.get(item_id)
+        if cached is None:
+            signature = self.signatures.get(item_id)
+            if signature is None:
+                return []
+            scored = []
+            for other in self._candidates(item_id):
+                matches = sum(1 for a, b in zip(signature, self.signatures[other]) if a == b)
+                scored.append((other, matches / self.num_perm))
+            cached = heapq.nlargest(self.cache_size, scored, key=lambda s: s[1])
+            self.cache[item_id] = cached
+            for neighbour, _ in cached:
+                self.cited_by[neighbour].add(item_id)
+        return cached[:limit]
@@ -0,0 +1,158 @@
+from __future__ import annotations
+import heapq
+import math
+from bisect import bisect_left, insort
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+TRENDING_WINDOWS: Dict[str, float] = {"1h": 3600.0, "24h": 86400.0, "7d": 604800.0}
+
+_GLOBAL = ""  # top-list key for "all categories"
+
+
+def _log_add(a: float, b: float) -> float:
+    """log(exp(a) + exp(b)) without overflow."""
+    if a == -math.inf:
+        return b
+    hi, lo = (a, b) if a >= b else (b, a)
+    return hi + math.log1p(math.exp(lo - hi))
+
+
+class _WindowTop:
+    """
+    Exponentially decayed rating counts for one window, with maintained top lists.
+
+    Scores use forward decay: each rating at time t adds exp((t - origin) / tau)
+    to the item's score, kept in log space. The decayed count at time now is
+    exp(log_score - (now - origin) / tau), so the ranking between items never
+    changes with time and the top lists only move when a rating arrives. Scores
+    only grow, so a bounded sorted list per category stays exact as items enter
+    it and evict its minimum. When an item leaves a list (category move or
+    delete) the list is refilled from that key's members, costing
+    O(members log capacity) on those rarer operations.
+    """
+
+    def __init__(self, tau: float, origin: float, capacity: int):
+        self.tau = tau
+        self.origin = origin
+        self.capacity = capacity
+        self.log_scores: Dict[str, float] = {}
+        self.top: Dict[str, List[Tuple[float, str]]] = {}
+        # key -> every scored item under it, including those outside the top list
+        self.members: Dict[str, Set[str]] = defaultdict(set)
+
+    def _discard(self, key: str, item_id: str) -> None:
+        entries = self.top.get(key)
+        score = self.log_scores.get(item_id)
+        if not entries or score is None:
+            return
+        i = bisect_left(entries, (score, item_id))
+        if i < len(entries) and entries[i] == (score, item_id):
+            del entries[i]
+
+    def _leave(self, key: str, item_id: str) -> None:
+        self._discard(key, item_id)
+        members = self.members.get(key)
+        if members is None:
+            return
+        members.discard(item_id)
+        if not members:
+            del self.members[key]
+            self.top.pop(key, None)
+            return
+        entries = self.top.get(key, [])
+        if len(entries) < self.capacity and len(members) > len(entries):
+            self.top[key] = sorted(heapq.nlargest(self.capacity, ((self.log_scores[i], i) for i in members)))
+
+    def _offer(self, key: str, item_id: str) -> None:
+        entries = self.top.setdefault(key, [])
+        entry = (self.log_scores[item_id], item_id)
+        if len(entries) < self.capacity:
+            insort(entries, entry)
+        elif entry > entries[0]:
+            insort(entries, entry)
+            del entries[0]
+
+    def record(self, item_id: str, keys: Tuple[str, ...], timestamp: float) -> None:
+        for key in keys:
+            self._discard(key, item_id)
+        previous = self.log_scores.get(item_id, -math.inf)
+        self.log_scores[item_id] = _log_add(previous, (timestamp - self.origin) / self.tau)
+        for key in keys:
+            self.members[key].add(item_id)
+            self._offer(key, item_id)
+
+    def move(self, item_id: str, old_key: str, new_key: str) -> None:
+        if item_id not in self.log_scores:
+            return
+        # An empty category has no list of its own (it would alias the global one).
+        if old_key != _GLOBAL:
+            self._leave(old_key, item_id)
+        if new_key != _GLOBAL:
+            self.members[new_key].add(item_id)
+            self._offer(new_key, item_id)
+
+    def remove(self, item_id: str, keys: Tuple[str, ...]) -> None:
+        if item_id not in self.log_scores:
+            return
+        for key in keys:
+            self._leave(key, item_id)
+        del self.log_scores[item_id]
+
+    def ranked(self, key: str, now: float, limit: int, min_score: float) -> List[Tuple[str, float]]:
+        shift = (now - self.origin) / self.tau
+        result: List[Tuple[str, float]] = []
+        for log_score, item_id in reversed(self.top.get(key, ())):
+            score = math.exp(log_score - shift)
+            if score < min_score or len(result) >= limit:
+                break
+            result.append((item_id, score))
+        return result
+
+
+class TrendingIndex:
+    """
+    Per-item time-decayed rating velocity for the 1h, 24h and 7d windows.
+
+    add_rating costs O(1) score work plus an O(capacity) top-list update per
+    window; trending listings are read straight from the maintained top lists.
+    """
+
+    def __init__(self, origin: float, capacity: int = 200, min_score: float = 0.01):
+        self.windows = {name: _WindowTop(tau, origin, capacity) for name, tau in TRENDING_WINDOWS.items()}
+        self.categories: Dict[str, str] = {}
+        self.min_score = min_score
+
+    def _keys(self, item_id: str) -> Tuple[str, ...]:
+        category = self.categories.get(item_id)
+        return (_GLOBAL, category) if category else (_GLOBAL,)
+
+    def record(self, item_id: str, category: str, timestamp: float) -> None:
+        if item_id in self.categories:
+            self.set_category(item_id, category)
+        else:
+            self.categories[item_id] = category.lower()
+        keys = self._keys(item_id)
+        for window in self.windows.values():
+            window.record(item_id, keys, timestamp)
+
+    def set_category(self, item_id: str, category: str) -> None:
+        new_key = category.lower()
+        old_key = self.categories.get(item_id)
+        if old_key is None or old_key == new_key:
+            # Items without ratings are not tracked yet.
+            return
+        self.categories[item_id] = new_key
+        for window in self.windows.values():
+            window.move(item_id, old_key, new_key)
+
+    def remove(self, item_id: str) -> None:
+        keys = self._keys(item_id)
+        for window in self.windows.values():
+            window.remove(item_id, keys)
+        self.categories.pop(item_id, None)
+
+    def trending(self, window: str, now: float, limit: int, category: Optional[str] = None) -> List[Tuple[str, float]]:
+        """Up to limit (item id, decayed rating count) for the window, hottest first."""
+        key = category.lower() if category else _GLOBAL
+        return self.windows[window].ranked(key, now, limit, self.min_score)
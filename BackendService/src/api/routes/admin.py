@@ -1,21 +1,59 @@
-from fastapi import APIRouter, Depends, HTTPException
-from enum import Enum
+from fastapi import APIRouter, Depends, HTTPException, Query
 
-from ..schemas.feedback import FeedbackOut
+from ..schemas.feedback import (
+    FeedbackStatus,
+    FeedbackQueueStatus,
+    FeedbackOut,
+    FeedbackPage,
+    FeedbackBatchStatusUpdate,
+    FeedbackBatchStatusResult,
+)
 from ..repositories.memory_repo import InMemoryRepository
 from ..services.feedback_service import FeedbackService
-from ..core.dependencies import get_required_user
+from ..core.dependencies import get_repository, get_pagination, get_required_user, PaginationParams
 from ..core.security import AuthUser, ensure_admin
 
 router = APIRouter()
 
 # Dependency
-def get_feedback_service(repo: InMemoryRepository = Depends(lambda: InMemoryRepository())) -> FeedbackService:
+def get_feedback_service(repo: InMemoryRepository = Depends(get_repository)) -> FeedbackService:
     return FeedbackService(repo)
 
-class FeedbackStatus(str, Enum):
-    approved = "approved"
-    rejected = "rejected"
+# PUBLIC_INTERFACE
+@router.get("/feedback", response_model=FeedbackPage)
+async def list_feedback_queue(
+    status: FeedbackQueueStatus = Query(FeedbackQueueStatus.pending, description="Moderation status to list"),
+    pagination: PaginationParams = Depends(get_pagination),
+    service: FeedbackService = Depends(get_feedback_service),
+    user: AuthUser = Depends(get_required_user),
+):
+    """
+    List feedback by moderation status, oldest first, with pagination.
+    Requires admin privileges.
+    """
+    ensure_admin(user)
+    items, total = service.list_by_status(status.value, pagination.page, pagination.per_page)
+    return {
+        "items": items,
+        "page": pagination.page,
+        "per_page": pagination.per_page,
+        "total": total,
+    }
+
+# PUBLIC_INTERFACE
+@router.patch("/feedback/status", response_model=FeedbackBatchStatusResult)
+async def moderate_feedback_batch(
+    payload: FeedbackBatchStatusUpdate,
+    service: FeedbackService = Depends(get_feedback_service),
+    user: AuthUser = Depends(get_required_user),
+):
+    """
+    Approve or reject many feedback items in one request.
+    Unknown IDs are reported in `missing`. Requires admin privileges.
+    """
+    ensure_admin(user)
+    updated, missing = service.set_status_many(payload.ids, payload.status.value)
+    return FeedbackBatchStatusResult(updated=len(updated), missing=missing)
 
 # PUBLIC_INTERFACE
 @router.patch("/feedback/{feedback_id}/status", response_model=FeedbackOut)
@@ -0,0 +1,85 @@
+import asyncio
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect, status
+from fastapi.responses import StreamingResponse
+
+from ..core.config import get_settings
+from ..core.events import EventBus, Subscriber, get_event_bus
+
+router = APIRouter()
+
+_KEEPALIVE_SSE = b": keepalive\n\n"
+
+
+def _subscribe(bus: EventBus, item_id: Optional[List[str]], category: Optional[List[str]]) -> Subscriber:
+    if not item_id and not category:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Subscribe to at least one item_id or category",
+        )
+    return bus.subscribe(item_ids=item_id or (), categories=category or ())
+
+
+# PUBLIC_INTERFACE
+@router.get("/stream", summary="Server-sent change events", response_class=StreamingResponse)
+async def stream_events(
+    item_id: Optional[List[str]] = Query(None, description="Item IDs to follow (repeatable)"),
+    category: Optional[List[str]] = Query(None, description="Categories to follow (repeatable)"),
+    bus: EventBus = Depends(get_event_bus),
+):
+    """
+    Stream item, rating and feedback changes as server-sent events.
+    Clients that fall too far behind lose the oldest buffered events and then
+    receive a `gap` event; they should refetch the state they follow.
+    """
+    subscriber = _subscribe(bus, item_id, category)
+    keepalive = get_settings().EVENTS_KEEPALIVE_SECONDS
+
+    async def frames():
+        async for event in subscriber.listen(keepalive=keepalive):
+            yield _KEEPALIVE_SSE if event is None else event.sse
+
+    return StreamingResponse(
+        frames(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _close_on_disconnect(websocket: WebSocket, subscriber: Subscriber) -> None:
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+    finally:
+        subscriber.close()
+
+
+# PUBLIC_INTERFACE
+@router.websocket("/ws")
+async def websocket_events(
+    websocket: WebSocket,
+    item_id: Optional[List[str]] = Query(None),
+    category: Optional[List[str]] = Query(None),
+    bus: EventBus = Depends(get_event_bus),
+):
+    """
+    WebSocket variant of /events/stream: each message is the JSON event envelope,
+    including `gap` events for slow consumers.
+    """
+    if not item_id and not category:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    await websocket.accept()
+    subscriber = bus.subscribe(item_ids=item_id or (), categories=category or ())
+    reader = asyncio.create_task(_close_on_disconnect(websocket, subscriber))
+    try:
+        async for event in subscriber.listen():
+            await websocket.send_text(event.envelope)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        reader.cancel()
+        subscriber.close()
@@ -4,13 +4,13 @@ from typing import List
 from ..schemas.feedback import FeedbackCreate, FeedbackOut
 from ..repositories.memory_repo import InMemoryRepository
 from ..services.feedback_service import FeedbackService
-from ..core.dependencies import get_required_user
+from ..core.dependencies import get_repository, get_required_user
 from ..core.security import AuthUser
 
 router = APIRouter()
 
 # Dependency
-def get_service(repo: InMemoryRepository = Depends(lambda: InMemoryRepository())) -> FeedbackService:
+def get_service(repo: InMemoryRepository = Depends(get_repository)) -> FeedbackService:
     return FeedbackService(repo)
 
 # PUBLIC_INTERFACE
@@ -1,24 +1,75 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
+import hashlib
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import JSONResponse
+from typing import Iterable, List, Optional, Tuple
 
 from ..schemas.food import (
     FoodItemCreate,
     FoodItemUpdate,
     FoodItemOut,
     FoodItemQuery,
-    PaginatedResponse,
+    FoodItemPage,
+    FoodItemBatch,
+    FoodItemBatchRequest,
+    SimilarFoodItemOut,
+    TrendingFoodItemOut,
+    FoodItemChanges,
+    FOOD_ITEM_FIELDS,
+    MAX_BATCH_IDS,
 )
+from ..models.domain import FoodItem
 from ..repositories.memory_repo import InMemoryRepository
 from ..services.items_service import ItemsService
-from ..core.dependencies import get_pagination, get_sorting, get_required_user, get_optional_user
+from ..core.dependencies import get_repository, get_pagination, get_sorting, get_required_user, get_optional_user
 from ..core.security import AuthUser, ensure_admin
 
 router = APIRouter()
 
 # Dependency
-def get_service(repo: InMemoryRepository = Depends(lambda: InMemoryRepository())) -> ItemsService:
+def get_service(repo: InMemoryRepository = Depends(get_repository)) -> ItemsService:
     return ItemsService(repo)
 
+def get_fields(
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated FoodItemOut fields to return (e.g. id,name,price,avg_rating); default all",
+    ),
+) -> Tuple[str, ...]:
+    """Parse and validate a sparse fieldset."""
+    if not fields:
+        return FOOD_ITEM_FIELDS
+    requested = tuple(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    unknown = [f for f in requested if f not in FOOD_ITEM_FIELDS]
+    if unknown or not requested:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}" if unknown else "No fields requested",
+        )
+    return requested
+
+def _project(items: Iterable[FoodItem], fields: Tuple[str, ...]) -> List[dict]:
+    return [{f: getattr(item, f) for f in fields} for item in items]
+
+def _batch_etag(items: List[FoodItem], missing: List[str], fields: Tuple[str, ...]) -> str:
+    """One ETag for the whole batch, derived from each item's id and last update."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(",".join(fields).encode())
+    for item in items:
+        digest.update(f"\n{item.id}\0{item.updated_at.isoformat()}".encode())
+    for item_id in missing:
+        digest.update(f"\n{item_id}\0-".encode())
+    return f'"{digest.hexdigest()}"'
+
+def _batch_response(
+    request: Request, service: ItemsService, ids: List[str], fields: Tuple[str, ...]
+) -> Response:
+    items, missing = service.get_items(ids)
+    etag = _batch_etag(items, missing, fields)
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return JSONResponse({"items": _project(items, fields), "missing": missing}, headers={"ETag": etag})
+
 # PUBLIC_INTERFACE
 @router.post("", response_model=FoodItemOut, status_code=status.HTTP_201_CREATED)
 async def create_food_item(
@@ -35,18 +86,25 @@ async def create_food_item(
     return item
 
 # PUBLIC_INTERFACE
-@router.get("", response_model=List[FoodItemOut])
+@router.get("", response_model=FoodItemPage)
 async def list_food_items(
     query: FoodItemQuery = Depends(),
     pagination: dict = Depends(get_pagination),
     sorting: dict = Depends(get_sorting),
+    fields: Tuple[str, ...] = Depends(get_fields),
     service: ItemsService = Depends(get_service),
     _: AuthUser | None = Depends(get_optional_user),
-) -> List[FoodItemOut]:
+):
     """
     List and search food items with filtering, sorting, and pagination.
+    Use `fields` to return only some item fields.
     No authentication required.
     """
+    if sorting.sort_by == "relevance" and not query.q:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="sort_by=relevance requires q",
+        )
     items, total = service.query_items(
         q=query.q,
         category=query.category,
@@ -60,13 +118,107 @@ async def list_food_items(
         sort_order=sorting.sort_order,
         page=pagination.page,
         per_page=pagination.per_page,
+        fuzzy=query.fuzzy,
     )
-    return PaginatedResponse(
-        items=items,
-        page=pagination.page,
-        per_page=pagination.per_page,
-        total=total,
-    ).model_dump()
+    # Items are projected straight from the domain objects and serialized in one
+    # pass; returning a Response skips per-item response_model validation.
+    return JSONResponse({
+        "items": _project(items, fields),
+        "page": pagination.page,
+        "per_page": pagination.per_page,
+        "total": total,
+    })
+
+# PUBLIC_INTERFACE
+@router.get("/trending", response_model=List[TrendingFoodItemOut])
+async def list_trending_food_items(
+    window: str = Query("24h", pattern="^(1h|24h|7d)$", description="Trending window (1h|24h|7d)"),
+    category: Optional[str] = Query(None, description="Restrict to a category"),
+    limit: int = Query(10, ge=1, le=50, description="Maximum number of items"),
+    service: ItemsService = Depends(get_service),
+    _: AuthUser | None = Depends(get_optional_user),
+):
+    """
+    Items with the most rating activity recently, weighted by exponential decay
+    over the window. Served from precomputed top lists.
+    No authentication required.
+    """
+    trending = service.trending_items(window, limit, category)
+    rows = _project((item for item, _ in trending), FOOD_ITEM_FIELDS)
+    for row, (_, score) in zip(rows, trending):
+        row["trend_score"] = round(score, 4)
+    return JSONResponse(rows)
+
+# PUBLIC_INTERFACE
+@router.get("/changes", response_model=FoodItemChanges)
+async def list_food_item_changes(
+    since: int = Query(
+        0,
+        ge=0,
+        description=(
+            "Cursor from a previous response (`next_since`). 0 reads every retained change; "
+            "once old deletions have been purged it returns `resync` like any expired cursor"
+        ),
+    ),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum changes per batch"),
+    service: ItemsService = Depends(get_service),
+    _: AuthUser | None = Depends(get_optional_user),
+):
+    """
+    Incremental sync: items created, updated or deleted after `since`, latest
+    state only, in bounded batches. If `resync` is true the cursor has expired
+    and the client must re-download the catalog before continuing.
+    No authentication required.
+    """
+    feed = service.changes_since(since, limit)
+    changes = []
+    for change in feed.changes:
+        item = None if change.deleted else _project((change.item,), FOOD_ITEM_FIELDS)[0]
+        changes.append({"seq": change.seq, "id": change.item_id, "deleted": change.deleted, "item": item})
+    return JSONResponse({
+        "changes": changes,
+        "next_since": feed.next_since,
+        "current_seq": feed.current_seq,
+        "has_more": feed.has_more,
+        "resync": feed.resync,
+    })
+
+# PUBLIC_INTERFACE
+@router.get("/batch", response_model=FoodItemBatch)
+async def get_food_items_batch(
+    request: Request,
+    ids: List[str] = Query(..., description="Food item IDs, repeated or comma-separated"),
+    fields: Tuple[str, ...] = Depends(get_fields),
+    service: ItemsService = Depends(get_service),
+    _: AuthUser | None = Depends(get_optional_user),
+):
+    """
+    Get many food items in one request; unknown IDs are listed in `missing`.
+    The response carries one ETag for the whole batch (If-None-Match -> 304).
+    No authentication required.
+    """
+    item_ids = [i for raw in ids for i in raw.split(",") if i]
+    if not item_ids or len(item_ids) > MAX_BATCH_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Provide between 1 and {MAX_BATCH_IDS} ids",
+        )
+    return _batch_response(request, service, item_ids, fields)
+
+# PUBLIC_INTERFACE
+@router.post("/batch", response_model=FoodItemBatch)
+async def post_food_items_batch(
+    request: Request,
+    payload: FoodItemBatchRequest,
+    fields: Tuple[str, ...] = Depends(get_fields),
+    service: ItemsService = Depends(get_service),
+    _: AuthUser | None = Depends(get_optional_user),
+):
+    """
+    Same as GET /items/batch, for id lists too long for a query string.
+    No authentication required.
+    """
+    return _batch_response(request, service, payload.ids, fields)
 
 # PUBLIC_INTERFACE
 @router.get("/{item_id}", response_model=FoodItemOut)
@@ -87,6 +239,30 @@ async def get_food_item(
         )
     return item
 
+# PUBLIC_INTERFACE
+@router.get("/{item_id}/similar", response_model=List[SimilarFoodItemOut])
+async def get_similar_food_items(
+    item_id: str,
+    limit: int = Query(10, ge=1, le=50, description="Maximum number of similar items"),
+    service: ItemsService = Depends(get_service),
+    _: AuthUser | None = Depends(get_optional_user),
+):
+    """
+    "You may also like" items sharing tags and raters with this item,
+    served from precomputed MinHash/LSH neighbours.
+    No authentication required.
+    """
+    similar = service.similar_items(item_id, limit)
+    if similar is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Food item not found",
+        )
+    rows = _project((item for item, _ in similar), FOOD_ITEM_FIELDS)
+    for row, (_, score) in zip(rows, similar):
+        row["similarity"] = round(score, 4)
+    return JSONResponse(rows)
+
 # PUBLIC_INTERFACE
 @router.patch("/{item_id}", response_model=FoodItemOut)
 async def update_food_item(
@@ -4,13 +4,13 @@ from typing import List
 from ..schemas.rating import RatingCreate, RatingOut
 from ..repositories.memory_repo import InMemoryRepository
 from ..services.ratings_service import RatingsService
-from ..core.dependencies import get_required_user
+from ..core.dependencies import get_repository, get_required_user
 from ..core.security import AuthUser
 
 router = APIRouter()
 
 # Dependency
-def get_service(repo: InMemoryRepository = Depends(lambda: InMemoryRepository())) -> RatingsService:
+def get_service(repo: InMemoryRepository = Depends(get_repository)) -> RatingsService:
     return RatingsService(repo)
 
 # PUBLIC_INTERFACE
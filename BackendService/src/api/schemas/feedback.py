@@ -1,6 +1,23 @@
+from enum import Enum
+from typing import List
 
 from pydantic import BaseModel, Field
 
+from .food import PaginatedResponse
+
+
+class FeedbackStatus(str, Enum):
+    """Statuses a moderator can set."""
+    approved = "approved"
+    rejected = "rejected"
+
+
+class FeedbackQueueStatus(str, Enum):
+    """Statuses of the moderation queue."""
+    pending = "pending"
+    approved = "approved"
+    rejected = "rejected"
+
 
 # PUBLIC_INTERFACE
 class FeedbackCreate(BaseModel):
@@ -17,3 +34,23 @@ class FeedbackOut(BaseModel):
     user_id: str = Field(..., description="User ID that submitted the feedback")
     message: str = Field(..., description="Feedback message")
     status: str = Field(..., description="Moderation status (pending|approved|rejected)")
+
+
+# PUBLIC_INTERFACE
+class FeedbackPage(PaginatedResponse):
+    """Paginated feedback moderation queue."""
+    items: List[FeedbackOut] = Field(default_factory=list, description="Feedback records, oldest first")
+
+
+# PUBLIC_INTERFACE
+class FeedbackBatchStatusUpdate(BaseModel):
+    """Batch moderation request."""
+    ids: List[str] = Field(..., min_length=1, max_length=10000, description="Feedback IDs to moderate")
+    status: FeedbackStatus = Field(..., description="New status")
+
+
+# PUBLIC_INTERFACE
+class FeedbackBatchStatusResult(BaseModel):
+    """Batch moderation outcome."""
+    updated: int = Field(..., ge=0, description="Number of feedback records updated")
+    missing: List[str] = Field(default_factory=list, description="Requested IDs that do not exist")
@@ -40,10 +40,26 @@ class FoodItemOut(FoodItemBase):
     rating_count: int = Field(..., ge=0, description="Total rating count")
 
 
+# PUBLIC_INTERFACE
+class FoodItemSparseOut(BaseModel):
+    """Food item in list responses: every field is present unless `fields` selects a subset."""
+    id: Optional[str] = Field(None, description="Food item ID")
+    name: Optional[str] = Field(None, description="Food item name")
+    description: Optional[str] = Field(None, description="Food item description")
+    category: Optional[str] = Field(None, description="Category (e.g., Dessert, Main Course)")
+    price: Optional[float] = Field(None, ge=0, description="Price value")
+    currency: Optional[str] = Field(None, min_length=3, max_length=3, description="Currency code (e.g., USD)")
+    location: Optional[str] = Field(None, description="Location associated with the item")
+    tags: Optional[List[str]] = Field(None, description="List of tags for filtering and search")
+    avg_rating: Optional[float] = Field(None, ge=0, le=5, description="Average rating")
+    rating_count: Optional[int] = Field(None, ge=0, description="Total rating count")
+
+
 # PUBLIC_INTERFACE
 class FoodItemQuery(BaseModel):
     """Query params for searching/filtering/sorting food items."""
     q: Optional[str] = Field(None, description="Search text across name, description, tags")
+    fuzzy: bool = Field(False, description="Typo-tolerant word matching for q (trigram index + edit distance)")
     category: Optional[str] = Field(None, description="Filter by category")
     location: Optional[str] = Field(None, description="Filter by location")
     min_price: Optional[float] = Field(None, ge=0, description="Minimum price")
@@ -51,7 +67,7 @@ class FoodItemQuery(BaseModel):
     min_rating: Optional[float] = Field(None, ge=0, le=5, description="Minimum average rating")
     max_rating: Optional[float] = Field(None, ge=0, le=5, description="Maximum average rating")
     tags: Optional[List[str]] = Field(None, description="Tags to include")
-    sort_by: Optional[str] = Field(None, description="Sort field (name, price, avg_rating, created_at)")
+    sort_by: Optional[str] = Field(None, description="Sort field (name, price, avg_rating, created_at, relevance)")
     sort_order: Optional[str] = Field(None, description="Sort order (asc|desc)")
 
 
@@ -61,3 +77,65 @@ class PaginatedResponse(BaseModel):
     page: int = Field(..., ge=1, description="Current page number")
     per_page: int = Field(..., ge=1, description="Items per page")
     total: int = Field(..., ge=0, description="Total items")
+
+
+# PUBLIC_INTERFACE
+class FoodItemPage(PaginatedResponse):
+    """Paginated food items. With `fields`, items contain only the requested fields."""
+    items: List[FoodItemSparseOut] = Field(
+        default_factory=list,
+        description="Food items on this page; all fields unless `fields` is given",
+    )
+
+
+# PUBLIC_INTERFACE
+class SimilarFoodItemOut(FoodItemOut):
+    """Food item recommended as similar to another one."""
+    similarity: float = Field(..., ge=0, le=1, description="Estimated Jaccard similarity of tags and raters")
+
+
+# PUBLIC_INTERFACE
+class FoodItemChange(BaseModel):
+    """One entry of the delta-sync feed: the latest state of an item, or its deletion."""
+    seq: int = Field(..., ge=1, description="Change sequence number")
+    id: str = Field(..., description="Food item ID")
+    deleted: bool = Field(..., description="True if the item was deleted (tombstone)")
+    item: Optional[FoodItemOut] = Field(None, description="Current item state; null for deletions")
+
+
+# PUBLIC_INTERFACE
+class FoodItemChanges(BaseModel):
+    """A bounded batch of item changes after a cursor."""
+    changes: List[FoodItemChange] = Field(default_factory=list, description="Changes in sequence order")
+    next_since: int = Field(..., ge=0, description="Cursor to pass as `since` for the next batch")
+    current_seq: int = Field(..., ge=0, description="Latest sequence number on the server")
+    has_more: bool = Field(..., description="More changes are available after next_since")
+    resync: bool = Field(..., description="Cursor expired: re-download the catalog, then continue from current_seq")
+
+
+# PUBLIC_INTERFACE
+class TrendingFoodItemOut(FoodItemOut):
+    """Food item ranked by recent rating activity."""
+    trend_score: float = Field(..., ge=0, description="Time-decayed rating count for the requested window")
+
+
+MAX_BATCH_IDS = 200
+
+
+# PUBLIC_INTERFACE
+class FoodItemBatchRequest(BaseModel):
+    """Ids to fetch in one batch request."""
+    ids: List[str] = Field(..., min_length=1, max_length=MAX_BATCH_IDS, description="Food item IDs")
+
+
+# PUBLIC_INTERFACE
+class FoodItemBatch(BaseModel):
+    """Batch lookup result. With `fields`, items contain only the requested fields."""
+    items: List[FoodItemSparseOut] = Field(
+        default_factory=list,
+        description="Found items, in request order; all fields unless `fields` is given",
+    )
+    missing: List[str] = Field(default_factory=list, description="Requested IDs that do not exist")
+
+
+FOOD_ITEM_FIELDS = tuple(FoodItemOut.model_fields)
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
 from uuid import uuid4
 
 from ..repositories.memory_repo import InMemoryRepository
@@ -26,3 +26,9 @@ class FeedbackService:
 
     def set_status(self, feedback_id: str, status: str) -> Optional[Feedback]:
         return self.repo.set_feedback_status(feedback_id, status)
+
+    def list_by_status(self, status: str, page: int, per_page: int) -> Tuple[List[Feedback], int]:
+        return self.repo.list_feedback_by_status(status, offset=(page - 1) * per_page, limit=per_page)
+
+    def set_status_many(self, feedback_ids: Iterable[str], status: str) -> Tuple[List[Feedback], List[str]]:
+        return self.repo.set_feedback_status_many(feedback_ids, status)
@@ -2,7 +2,7 @@ from typing import List, Optional, Tuple
 from uuid import uuid4
 
 from ..repositories.memory_repo import InMemoryRepository
-from ..models.domain import FoodItem
+from ..models.domain import ChangeFeed, FoodItem
 from ..schemas.food import FoodItemCreate, FoodItemUpdate
 
 
@@ -50,6 +50,18 @@ class ItemsService:
     def get_item(self, item_id: str) -> Optional[FoodItem]:
         return self.repo.get_item(item_id)
 
+    def get_items(self, item_ids: List[str]) -> Tuple[List[FoodItem], List[str]]:
+        return self.repo.get_items(item_ids)
+
+    def changes_since(self, since: int, limit: int) -> ChangeFeed:
+        return self.repo.changes_since(since, limit)
+
+    def trending_items(self, window: str, limit: int, category: Optional[str]) -> List[Tuple[FoodItem, float]]:
+        return self.repo.trending_items(window, limit, category)
+
+    def similar_items(self, item_id: str, limit: int) -> Optional[List[Tuple[FoodItem, float]]]:
+        return self.repo.similar_items(item_id, limit)
+
     def query_items(
         self,
         q: Optional[str],
@@ -64,7 +76,24 @@ class ItemsService:
         sort_order: Optional[str],
         page: int,
         per_page: int,
+        fuzzy: bool = False,
     ) -> Tuple[List[FoodItem], int]:
+        start = (page - 1) * per_page
+        if sort_by == "relevance" and q:
+            return self.repo.rank_items(
+                q=q,
+                offset=start,
+                limit=per_page,
+                category=category,
+                location=location,
+                min_price=min_price,
+                max_price=max_price,
+                min_rating=min_rating,
+                max_rating=max_rating,
+                tags=tags,
+                fuzzy=fuzzy,
+            )
+
         results = self.repo.query_items(
             q=q,
             category=category,
@@ -76,8 +105,8 @@ class ItemsService:
             tags=tags,
             sort_by=sort_by,
             sort_order=sort_order,
+            fuzzy=fuzzy,
         )
         total = len(results)
-        start = (page - 1) * per_page
         end = start + per_page
         return results[start:end], total
@@ -0,0 +1,42 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.core.events import EventBus
+from src.api.models.domain import FoodItem
+from src.api.repositories.memory_repo import InMemoryRepository
+
+
+@pytest.fixture
+def repo() -> InMemoryRepository:
+    """Seeded repository with a private event bus (no app settings needed)."""
+    return InMemoryRepository(events=EventBus())
+
+
+@pytest.fixture
+def make_item():
+    def make(item_id: str, name: str = "Dish", description: str = "", category: str = "Main Course",
+             tags=None, price: float = 10.0) -> FoodItem:
+        return FoodItem(
+            id=item_id,
+            name=name,
+            description=description,
+            category=category,
+            price=price,
+            currency="USD",
+            location="Naples",
+            tags=list(tags or []),
+        )
+
+    return make
+
+
+@pytest.fixture
+def client(repo) -> TestClient:
+    """HTTP client for an app backed by the repo fixture."""
+    # Imported here so repository-only tests do not build the app (and load settings).
+    from src.api.core.dependencies import get_repository
+    from src.api.main import create_app
+
+    app = create_app()
+    app.dependency_overrides[get_repository] = lambda: repo
+    return TestClient(app)
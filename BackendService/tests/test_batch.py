@@ -0,0 +1,52 @@
+from uuid import uuid4
+
+from src.api.models.domain import Rating
+
+
+def add_items(repo, make_item, *item_ids):
+    for item_id in item_ids:
+        repo.create_item(make_item(item_id, name=f"Dish {item_id}"))
+
+
+def test_get_items_keeps_request_order_and_reports_missing(repo, make_item):
+    add_items(repo, make_item, "a", "b", "c")
+    found, missing = repo.get_items(["c", "x", "a", "c", "y", "x"])
+    assert [i.id for i in found] == ["c", "a"]
+    assert missing == ["x", "y"]
+    assert repo.get_items([]) == ([], [])
+
+
+def test_batch_etag_follows_item_changes(client, repo, make_item):
+    add_items(repo, make_item, "a", "b")
+    params = {"ids": "a,b"}
+    first = client.get("/items/batch", params=params).headers["etag"]
+    assert client.get("/items/batch", params=params).headers["etag"] == first
+
+    repo.update_item("b", lambda i: setattr(i, "price", 99.0))
+    updated = client.get("/items/batch", params=params).headers["etag"]
+    assert updated != first
+
+    repo.add_rating(Rating(id=str(uuid4()), item_id="a", user_id="u", score=5, comment=None))
+    rated = client.get("/items/batch", params=params).headers["etag"]
+    assert rated not in (first, updated)
+
+
+def test_batch_etag_depends_on_fields_and_missing_ids(client, repo, make_item):
+    add_items(repo, make_item, "a")
+    full = client.get("/items/batch", params={"ids": "a"}).headers["etag"]
+    sparse = client.get("/items/batch", params={"ids": "a", "fields": "id,name"}).headers["etag"]
+    with_missing = client.get("/items/batch", params={"ids": "a,zz"}).headers["etag"]
+    assert len({full, sparse, with_missing}) == 3
+
+
+def test_batch_if_none_match(client, repo, make_item):
+    add_items(repo, make_item, "a", "b")
+    response = client.post("/items/batch", json={"ids": ["b", "a", "nope"]})
+    assert [i["id"] for i in response.json()["items"]] == ["b", "a"]
+    assert response.json()["missing"] == ["nope"]
+    etag = response.headers["etag"]
+    for header in (etag, f"W/{etag}", f'"other", W/{etag}'):
+        cached = client.post("/items/batch", json={"ids": ["b", "a", "nope"]}, headers={"If-None-Match": header})
+        assert cached.status_code == 304 and cached.headers["etag"] == etag
+    stale = client.post("/items/batch", json={"ids": ["b", "a"]}, headers={"If-None-Match": etag})
+    assert stale.status_code == 200
@@ -0,0 +1,83 @@
+import math
+
+from src.api.repositories.search_index import BM25Index, tokenize
+
+
+def ids(items):
+    return [i.id for i in items]
+
+
+def brute_force(index: BM25Index, q: str, doc_ids):
+    """Reference BM25 scores computed without pruning."""
+    n = len(index.doc_lengths)
+    avgdl = index.total_length / n
+    scores = {}
+    for doc_id in doc_ids:
+        score = 0.0
+        for term in set(tokenize(q)):
+            freq = index.postings.get(term, {}).get(doc_id)
+            if freq:
+                norm = index.K1 * (1 - index.B + index.B * index.doc_lengths[doc_id] / avgdl)
+                score += index.idf(term) * freq * (index.K1 + 1) / (freq + norm)
+        scores[doc_id] = score
+    return scores
+
+
+def add_soups(repo, make_item, n=40):
+    for i in range(n):
+        repo.create_item(make_item(
+            f"s{i:02d}",
+            name="Soup" if i % 3 == 0 else f"Stew {i}",
+            description="soup " * (i % 5) + "with bread",
+            tags=["soup"] if i % 4 == 0 else [],
+        ))
+
+
+def test_relevance_matches_same_items_as_default_search(repo, make_item):
+    add_soups(repo, make_item)
+    for q in ["choc", "soup", "chocolate pizza", "bread"]:
+        default = repo.query_items(q=q)
+        page, total = repo.rank_items(q=q, offset=0, limit=100)
+        assert total == len(default)
+        assert sorted(ids(page)) == sorted(ids(default))
+
+
+def test_relevance_pages_are_stable_and_disjoint(repo, make_item):
+    add_soups(repo, make_item)
+    full, total = repo.rank_items(q="soup", offset=0, limit=len(repo.items))
+    paged = []
+    for offset in range(0, total, 7):
+        page, page_total = repo.rank_items(q="soup", offset=offset, limit=7)
+        assert page_total == total
+        paged.extend(page)
+    assert ids(paged) == ids(full)
+    assert len(set(ids(paged))) == total
+
+
+def test_pruned_top_k_equals_full_scoring(repo, make_item):
+    add_soups(repo, make_item)
+    matched = [i.id for i in repo.query_items(q="soup")]
+    reference = brute_force(repo.bm25_index, "soup", matched)
+    expected = sorted(matched, key=lambda d: (-reference[d], matched.index(d)))[:5]
+    top = repo.bm25_index.top_k({"soup": 1.0}, matched, 5)
+    assert [d for d, _ in top] == expected
+    for doc_id, score in top:
+        assert math.isclose(score, reference[doc_id])
+
+
+def test_name_matches_rank_above_description_matches(repo, make_item):
+    repo.create_item(make_item("d", name="Bread Bowl", description="Served with soup"))
+    repo.create_item(make_item("n", name="Tomato Soup", description="Served with bread"))
+    page, _ = repo.rank_items(q="soup", offset=0, limit=10)
+    assert ids(page) == ["n", "d"]
+
+
+def test_bm25_statistics_follow_updates_and_deletes(repo, make_item):
+    repo.create_item(make_item("x", name="Gazpacho"))
+    assert ids(repo.rank_items(q="gazpacho", offset=0, limit=10)[0]) == ["x"]
+    repo.update_item("x", lambda i: setattr(i, "name", "Borscht"))
+    assert repo.rank_items(q="gazpacho", offset=0, limit=10) == ([], 0)
+    length_before = repo.bm25_index.total_length
+    repo.delete_item("x")
+    assert "borscht" not in repo.bm25_index.postings
+    assert repo.bm25_index.total_length < length_before
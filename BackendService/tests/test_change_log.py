@@ -0,0 +1,85 @@
+def sync(repo, since, limit):
+    """Follow the feed from since until has_more is false; returns (changes, cursor)."""
+    changes = []
+    while True:
+        feed = repo.changes_since(since, limit)
+        assert not feed.resync
+        changes.extend(feed.changes)
+        since = feed.next_since
+        if not feed.has_more:
+            return changes, since
+
+
+def test_feed_pages_with_has_more(repo, make_item):
+    start = repo.change_seq
+    for i in range(5):
+        repo.create_item(make_item(f"p{i}"))
+    first = repo.changes_since(start, 2)
+    assert [c.item_id for c in first.changes] == ["p0", "p1"]
+    assert first.has_more and first.current_seq == repo.change_seq
+    changes, cursor = sync(repo, first.next_since, 2)
+    assert [c.item_id for c in changes] == ["p2", "p3", "p4"]
+    assert cursor == repo.change_seq
+    assert repo.changes_since(cursor, 2).changes == []
+
+
+def test_feed_reports_latest_state_once_per_item(repo, make_item):
+    start = repo.change_seq
+    repo.create_item(make_item("a", name="Soup"))
+    repo.create_item(make_item("b"))
+    repo.update_item("a", lambda i: setattr(i, "name", "Stew"))
+    repo.delete_item("b")
+    changes, _ = sync(repo, start, 10)
+    assert [(c.item_id, c.deleted) for c in changes] == [("a", False), ("b", True)]
+    assert changes[0].item.name == "Stew"
+    assert changes[1].item is None
+
+
+def test_has_more_ignores_superseded_entries(repo, make_item):
+    start = repo.change_seq
+    repo.create_item(make_item("a"))
+    repo.create_item(make_item("b"))
+    repo.update_item("b", lambda i: setattr(i, "price", 1.0))
+    repo.update_item("b", lambda i: setattr(i, "price", 2.0))
+    repo.update_item("a", lambda i: setattr(i, "price", 3.0))
+    first = repo.changes_since(start, 1)
+    assert [c.item_id for c in first.changes] == ["b"] and first.has_more
+    second = repo.changes_since(first.next_since, 1)
+    assert [c.item_id for c in second.changes] == ["a"]
+    assert not second.has_more and second.next_since == repo.change_seq
+
+
+def test_compaction_keeps_feed_results(repo, make_item):
+    start = repo.change_seq
+    repo.create_item(make_item("a"))
+    repo.create_item(make_item("b"))
+    for n in range(1500):
+        repo.update_item("a", lambda i, n=n: setattr(i, "price", float(n)))
+    assert len(repo.change_log_seqs) < 1500  # dead entries were compacted away
+    changes, cursor = sync(repo, start, 1)
+    assert [c.item_id for c in changes] == ["b", "a"]
+    assert changes[1].item.price == 1499.0
+    assert cursor == repo.change_seq
+
+
+def test_tombstone_purge_expires_old_cursors(repo, make_item):
+    repo.CHANGELOG_MAX_TOMBSTONES = 2
+    for i in range(4):
+        repo.create_item(make_item(f"d{i}"))
+    cursor = repo.change_seq
+    for i in range(3):
+        repo.delete_item(f"d{i}")
+    # d0's tombstone was purged: a client at cursor could miss that deletion.
+    feed = repo.changes_since(cursor, 10)
+    assert feed.resync and feed.changes == []
+    assert feed.next_since == repo.change_seq
+    # After re-downloading, the client continues from current_seq.
+    repo.delete_item("d3")
+    changes, _ = sync(repo, feed.current_seq, 10)
+    assert [(c.item_id, c.deleted) for c in changes] == [("d3", True)]
+
+
+def test_cursor_from_the_future_requires_resync(repo):
+    feed = repo.changes_since(repo.change_seq + 1, 10)
+    assert feed.resync
+    assert feed.next_since == repo.change_seq
@@ -0,0 +1,105 @@
+import asyncio
+
+from src.api.core import events
+from src.api.core.events import EventBus
+from src.api.models.domain import Feedback
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+async def drain(subscriber):
+    """Everything the subscriber would send right now, then close it."""
+    subscriber.close()
+    return [event async for event in subscriber.listen()]
+
+
+def test_one_shared_event_per_publish():
+    async def main():
+        bus = EventBus()
+        by_item = bus.subscribe(item_ids=["a"])
+        by_category = bus.subscribe(categories=["Soup"])
+        both = bus.subscribe(item_ids=["a"], categories=["soup"])
+        bus.publish("item.updated", "a", "Soup", {"id": "a"})
+        received = [await drain(s) for s in (by_item, by_category, both)]
+        assert [len(r) for r in received] == [1, 1, 1]
+        assert received[0][0] is received[1][0] is received[2][0]
+        assert received[0][0].sse.startswith(b"id: 1\nevent: item.updated\n")
+
+    run(main())
+
+
+def test_nothing_is_serialized_without_subscribers(monkeypatch):
+    built = []
+
+    class Recording(events.ChangeEvent):
+        def __init__(self, *args):
+            built.append(args)
+            super().__init__(*args)
+
+    monkeypatch.setattr(events, "ChangeEvent", Recording)
+
+    async def main():
+        bus = EventBus()
+        subscriber = bus.subscribe(item_ids=["a"])
+        bus.publish("item.updated", "b", "Soup", {"id": "b"})
+        assert built == []
+        bus.publish("item.updated", "a", "Soup", {"id": "a"})
+        assert len(built) == 1
+        subscriber.close()
+
+    run(main())
+
+
+def test_overflow_drops_oldest_events_and_reports_a_gap():
+    async def main():
+        bus = EventBus(buffer_size=3)
+        subscriber = bus.subscribe(item_ids=["a"])
+        for n in range(5):
+            bus.publish("item.updated", "a", None, {"n": n})
+        assert not subscriber.closed
+        received = await drain(subscriber)
+        assert [e.type for e in received] == ["gap", "item.updated", "item.updated", "item.updated"]
+        gap = received[0]
+        assert gap.seq == 2 and '"dropped":2' in gap.envelope
+        assert [e.seq for e in received[1:]] == [3, 4, 5]
+
+    run(main())
+
+
+def test_close_ends_listen_and_cleans_up_topics():
+    async def main():
+        bus = EventBus()
+        first = bus.subscribe(item_ids=["a"], categories=["Soup"])
+        second = bus.subscribe(item_ids=["a"])
+        first.close()
+        assert set(bus.topics) == {"item:a"}
+        bus.publish("item.updated", "a", "Soup", {"id": "a"})
+        assert len(first.buffer) == 0 and len(second.buffer) == 1
+        second.close()
+        assert bus.topics == {}
+        assert [e.type for e in await drain(second)] == ["item.updated"]
+
+    run(main())
+
+
+def test_batch_moderation_publishes_one_event(repo, make_item):
+    async def main():
+        bus = EventBus(buffer_size=4)
+        repo.events = bus
+        repo.create_item(make_item("x", category="Soup"))
+        for i in range(300):
+            repo.add_feedback(Feedback(id=f"f{i}", item_id="x", user_id=f"u{i}", message="hi"))
+        by_item = bus.subscribe(item_ids=["x"])
+        by_category = bus.subscribe(categories=["soup"])
+        repo.set_feedback_status_many([f"f{i}" for i in range(300)], "approved")
+        # Unchanged statuses publish nothing.
+        repo.set_feedback_status_many(["f0", "f1"], "approved")
+        repo.set_feedback_status("f2", "approved")
+        for subscriber in (by_item, by_category):
+            received = await drain(subscriber)
+            assert [e.type for e in received] == ["feedback.status.batch"]
+            assert received[0].envelope.count('"item_id":"x"') == 300
+
+    run(main())
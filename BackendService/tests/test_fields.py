@@ -0,0 +1,40 @@
+import pytest
+from fastapi import HTTPException
+
+
+def get_fields(fields):
+    # Imported here like the client fixture: routes need the app's dependencies.
+    from src.api.routes.items import get_fields
+
+    return get_fields(fields=fields)
+
+
+def test_default_is_every_field():
+    from src.api.schemas.food import FOOD_ITEM_FIELDS
+
+    assert get_fields(None) == FOOD_ITEM_FIELDS
+    assert get_fields("") == FOOD_ITEM_FIELDS
+
+
+@pytest.mark.parametrize("fields, detail", [
+    ("id,colour", "Unknown fields: colour"),
+    (",", "No fields requested"),
+    (" , ,", "No fields requested"),
+])
+def test_invalid_fieldsets_are_rejected(fields, detail):
+    with pytest.raises(HTTPException) as error:
+        get_fields(fields)
+    assert error.value.status_code == 400 and error.value.detail == detail
+
+
+def test_repeated_fields_appear_once(client):
+    assert get_fields(" name,id ,name") == ("name", "id")
+    response = client.get("/items", params={"fields": "name,id,name", "per_page": 2})
+    assert response.status_code == 200
+    assert [list(item) for item in response.json()["items"]] == [["name", "id"], ["name", "id"]]
+
+
+def test_unknown_field_is_a_400_over_http(client):
+    response = client.get("/items", params={"fields": "id,secret"})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Unknown fields: secret"
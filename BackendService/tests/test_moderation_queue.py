@@ -0,0 +1,49 @@
+import pytest
+from pydantic import ValidationError
+
+from src.api.models.domain import Feedback
+from src.api.schemas.feedback import FeedbackBatchStatusUpdate, FeedbackStatus
+
+
+def add(repo, n):
+    for i in range(n):
+        repo.add_feedback(Feedback(id=f"f{i}", item_id="x", user_id=f"u{i}", message="hi"))
+
+
+def queue(repo, status, offset=0, limit=10):
+    page, total = repo.list_feedback_by_status(status, offset, limit)
+    return [fb.id for fb in page], total
+
+
+def test_pending_queue_is_oldest_first_and_paged(repo):
+    add(repo, 5)
+    assert queue(repo, "pending", 0, 2) == (["f0", "f1"], 5)
+    assert queue(repo, "pending", 2, 2) == (["f2", "f3"], 5)
+    assert queue(repo, "pending", 4, 2) == (["f4"], 5)
+
+
+def test_status_changes_move_feedback_between_queues(repo):
+    add(repo, 3)
+    repo.set_feedback_status("f1", "approved")
+    assert queue(repo, "pending") == (["f0", "f2"], 2)
+    assert queue(repo, "approved") == (["f1"], 1)
+    # Setting the same status again keeps its place.
+    repo.set_feedback_status("f1", "approved")
+    assert queue(repo, "approved") == (["f1"], 1)
+    assert repo.set_feedback_status("nope", "approved") is None
+
+
+def test_bulk_status_reports_missing_ids(repo):
+    add(repo, 3)
+    updated, missing = repo.set_feedback_status_many(["f2", "nope", "f0", "f2"], "rejected")
+    assert [fb.id for fb in updated] == ["f2", "f0"]
+    assert missing == ["nope"]
+    assert queue(repo, "rejected") == (["f2", "f0"], 2)
+    assert queue(repo, "pending") == (["f1"], 1)
+
+
+def test_batch_request_uses_the_status_enum():
+    request = FeedbackBatchStatusUpdate(ids=["f0"], status="approved")
+    assert request.status is FeedbackStatus.approved
+    with pytest.raises(ValidationError):
+        FeedbackBatchStatusUpdate(ids=["f0"], status="pending")
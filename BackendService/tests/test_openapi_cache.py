@@ -0,0 +1,68 @@
+import json
+
+import pytest
+
+from src.api import main
+from src.api.core.config import get_settings
+
+
+def production(path):
+    return get_settings().model_copy(update={"ENV": "production", "OPENAPI_CACHE_PATH": str(path)})
+
+
+def prebuilt(path, **changes):
+    """Write the schema generate_openapi would produce, marked so tests can tell it was served."""
+    app = main.create_app(get_settings().model_copy(update={"OPENAPI_CACHE_PATH": None}))
+    schema = dict(app.openapi())
+    schema[main.OPENAPI_FINGERPRINT_KEY] = main.openapi_fingerprint(app)
+    schema["x-prebuilt"] = True
+    schema.update(changes)
+    path.write_text(json.dumps(schema))
+
+
+def served(settings):
+    return main.create_app(settings).openapi().get("x-prebuilt", False)
+
+
+def test_production_serves_the_prebuilt_schema(tmp_path):
+    path = tmp_path / "openapi.json"
+    prebuilt(path)
+    assert served(production(path))
+
+
+def test_other_environments_generate_the_schema(tmp_path):
+    path = tmp_path / "openapi.json"
+    prebuilt(path)
+    assert not served(production(path).model_copy(update={"ENV": "development"}))
+
+
+@pytest.mark.parametrize("content", [None, "not json", "{}"])
+def test_missing_or_unmarked_file_falls_back(tmp_path, content):
+    path = tmp_path / "openapi.json"
+    if content is not None:
+        path.write_text(content)
+    settings = production(path)
+    schema = main.create_app(settings).openapi()
+    assert not schema.get("x-prebuilt") and "/items" in schema["paths"]
+
+
+def test_version_mismatch_falls_back(tmp_path):
+    path = tmp_path / "openapi.json"
+    prebuilt(path)
+    assert not served(production(path).model_copy(update={"APP_VERSION": "2.0.0"}))
+
+
+def test_code_change_falls_back(tmp_path, monkeypatch):
+    path = tmp_path / "openapi.json"
+    prebuilt(path, **{main.OPENAPI_FINGERPRINT_KEY: "built-from-other-code"})
+    assert not served(production(path))
+    # Any edit to the API sources (e.g. a new schema field) changes the fingerprint.
+    app = main.create_app(production(path))
+    before = main.openapi_fingerprint(app)
+    source = tmp_path / "api"
+    source.mkdir()
+    (source / "schemas.py").write_text("class Item:\n    name: str\n")
+    monkeypatch.setattr(main, "_API_DIR", str(source))
+    first = main.openapi_fingerprint(app)
+    (source / "schemas.py").write_text("class Item:\n    name: str\n    price: float\n")
+    assert len({before, first, main.openapi_fingerprint(app)}) == 3
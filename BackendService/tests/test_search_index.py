@@ -0,0 +1,82 @@
+from src.api.repositories.search_index import TrigramIndex, bounded_levenshtein, max_edits_for
+
+
+def names(items):
+    return [i.name for i in items]
+
+
+def test_bounded_levenshtein_at_budget_edge():
+    assert bounded_levenshtein("choclate", "chocolate", 1) == 1
+    assert bounded_levenshtein("chcolat", "chocolate", 2) == 2
+    # One edit over budget reports budget + 1, never the real (larger) distance.
+    assert bounded_levenshtein("chclat", "chocolate", 2) == 3
+    assert bounded_levenshtein("pizza", "sushi", 1) == 2
+    assert bounded_levenshtein("", "abc", 3) == 3
+    assert bounded_levenshtein("", "abcd", 3) == 4
+
+
+def test_edit_budget_by_length():
+    assert max_edits_for("pie") == 0
+    assert max_edits_for("choc") == 1
+    assert max_edits_for("choclate") == 2
+
+
+def test_trigram_candidates_cover_typos_and_prefixes(make_item):
+    index = TrigramIndex()
+    index.add(make_item("1", name="Chocolate Lava Cake"))
+    index.add(make_item("2", name="Chowder"))
+
+    assert index.similar_words("choclate") == {"chocolate": 1}
+    assert index.similar_words("choc") == {"chocolate": 1}
+    assert index.similar_words("cho") == {"chocolate": 1, "chowder": 1}
+    # Short words must match exactly (or as a prefix).
+    assert index.similar_words("cke") == {}
+    assert index.similar_words("cake") == {"cake": 0}
+
+
+def test_trigram_index_forgets_removed_words(make_item):
+    index = TrigramIndex()
+    index.add(make_item("1", name="Chocolate"))
+    index.remove("1")
+    assert index.similar_words("chocolate") == {}
+    assert not index.gram_words and not index.word_items
+
+
+def test_fuzzy_search_tolerates_typos(repo):
+    assert names(repo.query_items(q="choclate", fuzzy=True)) == ["Chocolate Lava Cake"]
+    assert names(repo.query_items(q="sushii platter", fuzzy=True)) == ["Sushi Platter"]
+    assert repo.query_items(q="choclate") == []
+
+
+def test_fuzzy_search_keeps_prefix_hits_of_exact_search(repo):
+    exact = names(repo.query_items(q="choc"))
+    assert exact == ["Chocolate Lava Cake"]
+    assert names(repo.query_items(q="choc", fuzzy=True)) == exact
+
+
+def test_fuzzy_search_applies_filters_and_sort(repo, make_item):
+    repo.create_item(make_item("x", name="Chocolate Tart", category="Dessert", price=3.0))
+    repo.create_item(make_item("y", name="Chocolate Chili", category="Main Course", price=9.0))
+
+    assert names(repo.query_items(q="choclate", fuzzy=True, category="Dessert")) == [
+        "Chocolate Lava Cake", "Chocolate Tart",
+    ]
+    by_price = repo.query_items(q="choclate", fuzzy=True, sort_by="price", sort_order="desc")
+    assert names(by_price) == ["Chocolate Chili", "Chocolate Lava Cake", "Chocolate Tart"]
+
+
+def test_fuzzy_search_keeps_distance_order_without_a_sort_field(repo, make_item):
+    repo.create_item(make_item("x", name="Chocolat Pie"))
+    repo.create_item(make_item("y", name="Chocolate Tart"))
+    closest_first = ["Chocolate Lava Cake", "Chocolate Tart", "Chocolat Pie"]
+    assert names(repo.query_items(q="chocolate", fuzzy=True)) == closest_first
+    assert names(repo.query_items(q="chocolate", fuzzy=True, sort_by="unknown")) == closest_first
+
+
+def test_fuzzy_index_follows_updates_and_deletes(repo, make_item):
+    repo.create_item(make_item("x", name="Tiramisu"))
+    repo.update_item("x", lambda i: setattr(i, "name", "Panna Cotta"))
+    assert repo.query_items(q="tiramsu", fuzzy=True) == []
+    assert names(repo.query_items(q="pana cotta", fuzzy=True)) == ["Panna Cotta"]
+    repo.delete_item("x")
+    assert repo.query_items(q="pana cotta", fuzzy=True) == []
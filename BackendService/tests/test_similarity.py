@@ -0,0 +1,54 @@
+from uuid import uuid4
+
+from src.api.models.domain import Rating
+from src.api.repositories.similarity_index import MinHashLSH, _permutations
+
+
+def rate(repo, item_id, user_id, score=5):
+    repo.add_rating(Rating(id=str(uuid4()), item_id=item_id, user_id=user_id, score=score, comment=None))
+
+
+def neighbours(repo, item_id, limit=10):
+    return {item.id: score for item, score in repo.similar_items(item_id, limit)}
+
+
+def test_permutations_are_shared_and_deterministic():
+    assert MinHashLSH()._perms == _permutations(64)
+    assert MinHashLSH(num_perm=32, bands=8)._perms == _permutations(64)[:32]
+
+
+def test_identical_tags_are_similar(repo, make_item):
+    repo.create_item(make_item("a", tags=["ramen", "noodles", "spicy"]))
+    repo.create_item(make_item("b", tags=["ramen", "noodles", "spicy"]))
+    repo.create_item(make_item("c", tags=["cake", "chocolate"]))
+    found = neighbours(repo, "a")
+    assert found.get("b") == 1.0
+    assert "c" not in found
+    assert repo.similar_items("nope", 5) is None
+
+
+def test_shared_raters_make_items_similar(repo, make_item):
+    repo.create_item(make_item("a"))
+    repo.create_item(make_item("b"))
+    assert neighbours(repo, "a") == {}  # no features yet
+    for user in ("u1", "u2", "u3"):
+        rate(repo, "a", user)
+        rate(repo, "b", user)
+    assert neighbours(repo, "a").get("b") == 1.0
+
+
+def test_cache_is_invalidated_when_a_neighbour_changes(repo, make_item):
+    repo.create_item(make_item("a", tags=["ramen", "noodles"]))
+    repo.create_item(make_item("b", tags=["ramen", "noodles"]))
+    assert neighbours(repo, "a").get("b") == 1.0  # now cached
+    repo.update_item("b", lambda i: setattr(i, "tags", ["cake", "chocolate"]))
+    assert "b" not in neighbours(repo, "a")
+
+
+def test_deleted_items_are_not_recommended(repo, make_item):
+    repo.create_item(make_item("a", tags=["ramen", "noodles"]))
+    repo.create_item(make_item("b", tags=["ramen", "noodles"]))
+    assert "b" in neighbours(repo, "a")
+    repo.delete_item("b")
+    assert "b" not in neighbours(repo, "a")
+    assert repo.similar_items("b", 5) is None
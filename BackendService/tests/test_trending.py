@@ -0,0 +1,102 @@
+import math
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from src.api.models.domain import Rating
+from src.api.repositories.memory_repo import _utc_timestamp
+from src.api.repositories.trending_index import TrendingIndex
+
+NOW = 1_000_000.0
+HOUR = 3600.0
+
+
+def rate(repo, item_id, times=1):
+    for _ in range(times):
+        repo.add_rating(Rating(id=str(uuid4()), item_id=item_id, user_id=str(uuid4()), score=4, comment=None))
+
+
+def ranked_ids(index, window, category=None, now=NOW):
+    return [item_id for item_id, _ in index.trending(window, now, 10, category)]
+
+
+def test_windows_weigh_recent_ratings_differently():
+    index = TrendingIndex(origin=NOW - 7 * 24 * HOUR)
+    for _ in range(5):
+        index.record("steady", "Soup", NOW - 6 * HOUR)
+    for _ in range(2):
+        index.record("burst", "Soup", NOW)
+    assert ranked_ids(index, "1h") == ["burst", "steady"]
+    assert ranked_ids(index, "7d") == ["steady", "burst"]
+    scores = dict(index.trending("24h", NOW, 10))
+    assert abs(scores["burst"] - 2.0) < 1e-9
+
+
+def test_old_activity_drops_below_min_score():
+    index = TrendingIndex(origin=NOW)
+    index.record("a", "Soup", NOW)
+    assert ranked_ids(index, "1h", now=NOW + 24 * HOUR) == []
+    assert ranked_ids(index, "7d", now=NOW + 24 * HOUR) == ["a"]
+
+
+def test_empty_category_only_uses_the_global_list():
+    index = TrendingIndex(origin=NOW)
+    index.record("a", "", NOW)
+    assert ranked_ids(index, "1h") == ["a"]
+    index.set_category("a", "Dessert")
+    assert ranked_ids(index, "1h", "dessert") == ["a"]
+    index.set_category("a", "")
+    assert ranked_ids(index, "1h", "dessert") == []
+    assert ranked_ids(index, "1h") == ["a"]
+
+
+def test_lists_refill_when_items_leave():
+    index = TrendingIndex(origin=NOW, capacity=5)
+    for n in range(12):
+        for _ in range(n + 1):
+            index.record(f"s{n:02d}", "Soup", NOW)
+    # Move the five hottest away: the next five Soup items take their places.
+    for n in range(7, 12):
+        index.set_category(f"s{n:02d}", "Dessert")
+    assert ranked_ids(index, "24h", "soup") == ["s06", "s05", "s04", "s03", "s02"]
+    assert ranked_ids(index, "24h", "dessert") == ["s11", "s10", "s09", "s08", "s07"]
+    for n in range(7, 12):
+        index.remove(f"s{n:02d}")
+    assert ranked_ids(index, "24h") == ["s06", "s05", "s04", "s03", "s02"]
+    for n in range(7):
+        index.remove(f"s{n:02d}")
+    assert ranked_ids(index, "24h") == [] and index.windows["24h"].top == {}
+
+
+def test_naive_rating_times_are_utc(repo, make_item):
+    assert _utc_timestamp(datetime(1970, 1, 1)) == 0.0
+    assert _utc_timestamp(datetime(1970, 1, 1, 1, tzinfo=timezone(timedelta(hours=1)))) == 0.0
+    repo.create_item(make_item("a"))
+    two_hours_ago = datetime.utcnow() - timedelta(hours=2)
+    repo.add_rating(Rating(id="r", item_id="a", user_id="u", score=4, comment=None, created_at=two_hours_ago))
+    ((item, score),) = repo.trending_items("1h", 10)
+    assert item.id == "a" and abs(score - math.exp(-2)) < 1e-3
+
+
+def test_trending_follows_category_moves(repo, make_item):
+    repo.create_item(make_item("a", category="Soup"))
+    repo.create_item(make_item("b", category="Soup"))
+    rate(repo, "a", 3)
+    rate(repo, "b", 1)
+    assert [i.id for i, _ in repo.trending_items("1h", 10, "soup")] == ["a", "b"]
+    repo.update_item("a", lambda i: setattr(i, "category", "Dessert"))
+    assert [i.id for i, _ in repo.trending_items("1h", 10, "soup")] == ["b"]
+    assert [i.id for i, _ in repo.trending_items("1h", 10, "dessert")] == ["a"]
+    assert [i.id for i, _ in repo.trending_items("1h", 10)] == ["a", "b"]
+    # A later rating keeps the item under its new category.
+    rate(repo, "a")
+    assert [i.id for i, _ in repo.trending_items("1h", 10, "soup")] == ["b"]
+
+
+def test_deleted_items_leave_trending(repo, make_item):
+    repo.create_item(make_item("a", category="Soup"))
+    repo.create_item(make_item("b", category="Soup"))
+    rate(repo, "a", 2)
+    rate(repo, "b")
+    repo.delete_item("a")
+    assert [i.id for i, _ in repo.trending_items("24h", 10)] == ["b"]
+    assert [i.id for i, _ in repo.trending_items("24h", 10, "soup")] == ["b"]